@@ -1,11 +1,196 @@
 import json
+import logging
+import mmap
 import os
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+import numpy as np
 import pandas as pd
-from typing import Dict, List
+from typing import Dict, List, Tuple
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from logging.handlers import MemoryHandler
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _dumps_line(obj):
+        return orjson.dumps(obj) + b"\n"
+    _loads = orjson.loads
+else:
+    def _dumps_line(obj):
+        return (json.dumps(obj, separators=(',', ':')) + "\n").encode()
+    _loads = json.loads
+
+_ELLIPSIS = '...'
+
+_ACTION_ICONS = {
+    'price_adjustment': '💰',
+    'customer_response': '📧',
+    'social_media_post': '📱',
+    'urgent_alert': '⚠️'
+}
+
+def _feed_entry(action, fallback_type, fallback_ts):
+    """Preformatted dashboard feed entry for one executed action"""
+
+    # `or`, not a get() default: records decoded from the columnar log
+    # carry None for keys the original action never had
+    action_type = action.get('action_type') or fallback_type
+
+    if action_type == 'price_adjustment':
+        description = (
+            f"Adjusted price on {action.get('stock_number', 'Unknown')}: "
+            f"${action.get('old_price', 0):,.0f} → ${action.get('new_price', 0):,.0f}"
+        )
+    elif action_type == 'customer_response':
+        description = f"Responded to {action.get('customer_name', 'Customer')}: {action.get('subject', 'inquiry')}"
+    elif action_type == 'social_media_post':
+        description = f"Posted to {action.get('platform', 'social media')}"
+    elif action_type == 'urgent_alert':
+        description = f"Alert: {action.get('message', 'Action required')}"
+    else:
+        description = "Action completed"
+
+    return {
+        'timestamp': action.get('timestamp') or fallback_ts,
+        'type': action_type,
+        'status': action.get('status'),
+        'description': description,
+        'icon': _ACTION_ICONS.get(action_type, '🤖')
+    }
+
+def _tail_lines(path, n):
+    """Yield the last n lines of a file without reading the whole thing"""
+
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            # Walk backward n newlines from the end (ignoring the terminator)
+            pos = size
+            if mm[pos - 1:pos] == b"\n":
+                pos -= 1
+
+            for _ in range(n):
+                found = mm.rfind(b"\n", 0, pos)
+                if found == -1:
+                    pos = 0
+                    break
+                pos = found
+            else:
+                pos += 1
+
+            for line in bytes(mm[pos:size]).splitlines():
+                if line:
+                    yield line
+        finally:
+            mm.close()
+
+def _to_soa(records):
+    """Project a list of result dicts to columnar lists for the log.
+
+    Keys are stored once per category instead of once per record, which
+    roughly halves the serialized size of a big cycle."""
+
+    if not isinstance(records, list) or not records:
+        return records
+
+    keys = {}
+    for record in records:
+        for key in record:
+            keys.setdefault(key)
+
+    return {'_soa': {key: [record.get(key) for record in records] for key in keys}}
+
+def _from_soa(value):
+    """Rebuild the list-of-dicts view from a columnar log entry"""
+
+    if isinstance(value, dict) and '_soa' in value:
+        columns = value['_soa']
+        return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+    return value
+
+def _atomic_to_csv(df, path):
+    """Write a DataFrame to CSV via a temp file so a crash mid-write
+    can never leave a truncated data file behind"""
+
+    tmp = path + '.tmp'
+
+    with open(tmp, 'w', buffering=1 << 20, newline='') as fh:
+        df.to_csv(fh, index=False)
+
+    os.replace(tmp, path)
+
+# Buffer action chatter in memory and flush once per cycle instead of
+# hitting stdout (and a syscall) for every single action
+logger = logging.getLogger('executor')
+if not logger.handlers:
+    _stream_handler = logging.StreamHandler(sys.stdout)
+    _stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    _log_buffer = MemoryHandler(capacity=256, flushLevel=logging.ERROR, target=_stream_handler)
+    logger.addHandler(_log_buffer)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+class _BatchEmailer:
+    """
+    Feeds all outbound emails for one cycle through a single sender.
+
+    In demo mode that is one buffered append-only JSONL log handle. In
+    production the same interface would hold one pooled SMTP connection
+    (or accumulate a single SendGrid batch request) instead of opening a
+    session per message.
+    """
+
+    def __init__(self, ts: str):
+        self.ts = ts
+        self._fh = None
+
+    def open(self):
+        # Daily file name derived from the cycle timestamp - no extra
+        # datetime.now()/strftime call, and appends can never collide
+        day = self.ts[:10].replace('-', '')
+        self._fh = open(f"logs/emails/{day}.jsonl", 'a', buffering=1 << 16)
+        return self
+
+    def close(self):
+        # In production: smtp.quit() / flush the batch request here
+        if self._fh:
+            self._fh.close()
+            self._fh = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def send(self, to: str, subject: str, body: str) -> Dict:
+        """Queue one email on the shared sender and return its log record"""
+
+        email_log = {
+            'sent': True,
+            'to': to,
+            'subject': subject,
+            'timestamp': self.ts,
+            'method': 'demo_mode'
+        }
+
+        self._fh.write(json.dumps({**email_log, 'body': body}) + "\n")
+
+        return email_log
 
 class ActionExecutor:
     """
@@ -13,23 +198,38 @@ class ActionExecutor:
     This is what makes it "agentic" - it actually DOES things
     """
     
-    def __init__(self, dry_run=False):
+    def __init__(self, dry_run=False, summary_only=False):
         """
         Args:
             dry_run: If True, only simulates actions without executing
+            summary_only: With dry_run, skip the per-action result dicts and
+                return compact numeric summaries instead (for large decision
+                sets where the dict building dominates)
         """
         self.dry_run = dry_run
+        self.summary_only = summary_only
         self.action_log = []
-        self.log_file = 'logs/agent_actions.json'
-        
-        # Ensure logs directory exists
+        self.log_file = 'logs/agent_actions.jsonl'
+        self.legacy_log_file = 'logs/agent_actions.json'
+        self.max_log_bytes = 1 << 20  # rotate to .1 past 1 MB
+
+        # Newest-first ring buffer backing the dashboard activity feed;
+        # entries are formatted once at execution time, not per request
+        self.recent_actions = deque(maxlen=50)
+
+        # Ensure log directories exist once, not per email/post
         os.makedirs('logs', exist_ok=True)
+        os.makedirs('logs/emails', exist_ok=True)
+        os.makedirs('logs/social', exist_ok=True)
         
     def execute_all_actions(self, decisions: Dict, inventory_df: pd.DataFrame, inquiries_df: pd.DataFrame):
         """Execute all actions from agent decisions"""
         
+        # One timestamp shared by this cycle and every record it produces
+        ts = datetime.now().isoformat()
+
         results = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': ts,
             'total_actions': 0,
             'successful_actions': 0,
             'failed_actions': 0,
@@ -37,58 +237,77 @@ class ActionExecutor:
             'details': []
         }
         
-        # Execute price adjustments
+        # The four categories touch independent state (inventory frame,
+        # inquiries frame, social log, alert log), so run them concurrently -
+        # emails and posts are I/O-bound in production
+        tasks = []
+
         if 'price_adjustments' in decisions:
-            price_results = self.execute_price_adjustments(
-                decisions['price_adjustments'], 
-                inventory_df
-            )
-            results['actions_by_type']['price_adjustments'] = price_results
-            results['total_actions'] += len(price_results)
-            results['successful_actions'] += sum(1 for r in price_results if r['status'] == 'success')
-        
-        # Execute customer responses
+            tasks.append(('price_adjustments', self.execute_price_adjustments,
+                          (decisions['price_adjustments'], inventory_df)))
+
         if 'customer_responses' in decisions:
-            email_results = self.execute_customer_responses(
-                decisions['customer_responses'],
-                inquiries_df
-            )
-            results['actions_by_type']['customer_responses'] = email_results
-            results['total_actions'] += len(email_results)
-            results['successful_actions'] += sum(1 for r in email_results if r['status'] == 'success')
-        
-        # Execute social media posts
+            tasks.append(('customer_responses', self.execute_customer_responses,
+                          (decisions['customer_responses'], inquiries_df)))
+
         if 'social_media_posts' in decisions:
-            social_results = self.execute_social_media_posts(
-                decisions['social_media_posts']
-            )
-            results['actions_by_type']['social_media_posts'] = social_results
-            results['total_actions'] += len(social_results)
-            results['successful_actions'] += sum(1 for r in social_results if r['status'] == 'success')
-        
-        # Log urgent alerts
+            tasks.append(('social_media_posts', self.execute_social_media_posts,
+                          (decisions['social_media_posts'],)))
+
         if 'urgent_alerts' in decisions:
-            alert_results = self.log_urgent_alerts(
-                decisions['urgent_alerts']
-            )
-            results['actions_by_type']['urgent_alerts'] = alert_results
-            results['total_actions'] += len(alert_results)
-            results['successful_actions'] += len(alert_results)
-        
+            tasks.append(('urgent_alerts', self.log_urgent_alerts,
+                          (decisions['urgent_alerts'],)))
+
+        if tasks:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                futures = {pool.submit(fn, *args, ts=ts): name for name, fn, args in tasks}
+
+                for future in as_completed(futures):
+                    name = futures[future]
+                    outcome = future.result()
+
+                    if name == 'urgent_alerts':
+                        category_results, success_count = outcome, len(outcome)
+                    else:
+                        category_results, success_count = outcome
+
+                    results['actions_by_type'][name] = category_results
+
+                    if isinstance(category_results, dict):
+                        # summary-only mode returns counts, not per-action dicts
+                        results['total_actions'] += category_results.get('count', 0)
+                    else:
+                        results['total_actions'] += len(category_results)
+                    results['successful_actions'] += success_count
+
         results['failed_actions'] = results['total_actions'] - results['successful_actions']
         
         # Save to log
         self._save_action_log(results)
-        
+
+        # One flush for the whole cycle's log output
+        for handler in logger.handlers:
+            handler.flush()
+
         return results
     
-    def execute_price_adjustments(self, adjustments: List[Dict], inventory_df: pd.DataFrame) -> List[Dict]:
+    def execute_price_adjustments(self, adjustments: List[Dict], inventory_df: pd.DataFrame, ts: str = None) -> Tuple[List[Dict], int]:
         """Execute price changes in the system"""
-        
+
+        ts = ts or datetime.now().isoformat()
         results = []
-        
-        print(f"\n💰 Executing {len(adjustments)} price adjustments...")
-        
+        success_count = 0
+        pending = []  # (row, new_price) pairs applied in one batch after the loop
+
+        # One O(rows) pass up front; every adjustment below is an O(1) lookup
+        vin_to_row = {v: i for i, v in enumerate(inventory_df['vin'].values)}
+        prices = inventory_df['current_price'].values
+
+        if self.dry_run and self.summary_only:
+            return self._summarize_price_adjustments(adjustments, vin_to_row, prices, ts)
+
+        logger.info(f"\n💰 Executing {len(adjustments)} price adjustments...")
+
         for adjustment in adjustments:
             try:
                 vin = adjustment.get('vin')
@@ -96,36 +315,34 @@ class ActionExecutor:
                 reason = adjustment.get('reason', 'AI recommendation')
                 
                 if not vin or not new_price:
-                    print(f"⚠️ Skipping adjustment - missing VIN or price")
+                    logger.info(f"⚠️ Skipping adjustment - missing VIN or price")
                     results.append({
                         'status': 'failed',
                         'error': 'Missing VIN or price',
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': ts
                     })
                     continue
                 
                 # Find vehicle in inventory
-                vehicle = inventory_df[inventory_df['vin'] == vin]
-                
-                if vehicle.empty:
-                    print(f"⚠️ Vehicle not found: {vin}")
+                row = vin_to_row.get(vin)
+
+                if row is None:
+                    logger.info(f"⚠️ Vehicle not found: {vin}")
                     results.append({
                         'vin': vin,
                         'status': 'failed',
                         'error': 'Vehicle not found',
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': ts
                     })
                     continue
-                
-                old_price = vehicle.iloc[0]['current_price']
+
+                old_price = prices[row]
                 
                 if self.dry_run:
                     action_type = 'SIMULATED'
                 else:
-                    # Update the CSV
-                    inventory_df.loc[inventory_df['vin'] == vin, 'current_price'] = new_price
-                    inventory_df.loc[inventory_df['vin'] == vin, 'last_price_change'] = datetime.now().isoformat()
-                    inventory_df.to_csv('data/inventory.csv', index=False)
+                    # Queue the change - all rows are updated in one pass after the loop
+                    pending.append((row, new_price))
                     action_type = 'EXECUTED'
                 
                 result = {
@@ -141,49 +358,109 @@ class ActionExecutor:
                     'confidence': adjustment.get('confidence', 0.8),
                     'urgency': adjustment.get('urgency', 'medium'),
                     'execution_type': action_type,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': ts
                 }
                 
                 results.append(result)
+                success_count += 1
                 
-                print(f"  {'💰' if not self.dry_run else '💭'} {adjustment.get('stock_number')}: ${old_price:,.0f} → ${new_price:,.0f} ({action_type})")
+                logger.info(f"  {'💰' if not self.dry_run else '💭'} {adjustment.get('stock_number')}: ${old_price:,.0f} → ${new_price:,.0f} ({action_type})")
                 
             except Exception as e:
-                print(f"  ❌ Error: {str(e)}")
+                logger.info(f"  ❌ Error: {str(e)}")
                 results.append({
                     'vin': adjustment.get('vin'),
                     'status': 'failed',
                     'error': str(e),
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': ts
                 })
-        
-        print(f"✅ Completed: {sum(1 for r in results if r['status'] == 'success')}/{len(results)} successful\n")
-        
-        return results
+
+        # Apply all queued changes by position on the column arrays (no
+        # per-row boolean masks, no index realignment), then one CSV rewrite
+        if pending:
+            new_prices = inventory_df['current_price'].to_numpy(copy=True)
+            price_changes = inventory_df['last_price_change'].to_numpy(copy=True)
+
+            for row, new_price in pending:
+                new_prices[row] = new_price
+                price_changes[row] = ts
+
+            inventory_df['current_price'] = new_prices
+            inventory_df['last_price_change'] = price_changes
+
+            _atomic_to_csv(inventory_df, 'data/inventory.csv')
+
+        logger.info(f"✅ Completed: {success_count}/{len(results)} successful\n")
+
+        return results, success_count
+
+    def _summarize_price_adjustments(self, adjustments, vin_to_row, prices, ts):
+        """Summary-only dry run: counts and price deltas, no per-action dicts"""
+
+        # (row, old_price, new_price) per valid adjustment
+        plan = np.empty((len(adjustments), 3), dtype=np.float64)
+        n = 0
+
+        for adjustment in adjustments:
+            new_price = adjustment.get('recommended_price')
+            row = vin_to_row.get(adjustment.get('vin'))
+
+            if row is None or not new_price:
+                continue
+
+            plan[n, 0] = row
+            plan[n, 1] = prices[row]
+            plan[n, 2] = new_price
+            n += 1
+
+        plan = plan[:n]
+
+        summary = {
+            'action_type': 'price_adjustment_summary',
+            'count': n,
+            'skipped': len(adjustments) - n,
+            'total_delta': float((plan[:, 2] - plan[:, 1]).sum()) if n else 0.0,
+            'timestamp': ts
+        }
+
+        return summary, n
     
-    def execute_customer_responses(self, responses: List[Dict], inquiries_df: pd.DataFrame) -> List[Dict]:
+    def execute_customer_responses(self, responses: List[Dict], inquiries_df: pd.DataFrame, ts: str = None) -> Tuple[List[Dict], int]:
         """Send email responses to customers"""
-        
+
+        ts = ts or datetime.now().isoformat()
         results = []
-        
+        success_count = 0
+        responded = []  # inquiry_ids marked responded in one batch after the loop
+
+        # Index inquiries once so each response is an O(1) lookup
+        inquiry_to_row = {q: i for i, q in enumerate(inquiries_df['inquiry_id'].values)}
+        emails = inquiries_df['customer_email'].values
+        names = inquiries_df['customer_name'].values
+
+        # One batched sender for the whole cycle instead of a session per email
+        emailer = None
+        if not self.dry_run and responses:
+            emailer = _BatchEmailer(ts).open()
+
         for response in responses:
             try:
                 inquiry_id = response.get('inquiry_id')
-                
+
                 # Find inquiry
-                inquiry = inquiries_df[inquiries_df['inquiry_id'] == inquiry_id]
-                
-                if inquiry.empty:
+                row = inquiry_to_row.get(inquiry_id)
+
+                if row is None:
                     results.append({
                         'inquiry_id': inquiry_id,
                         'status': 'failed',
                         'error': 'Inquiry not found',
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': ts
                     })
                     continue
-                
-                customer_email = inquiry.iloc[0]['customer_email']
-                customer_name = inquiry.iloc[0]['customer_name']
+
+                customer_email = emails[row]
+                customer_name = names[row]
                 
                 if self.dry_run:
                     action_type = 'SIMULATED'
@@ -196,15 +473,14 @@ class ActionExecutor:
                 else:
                     # In production, this would send actual email via SendGrid/AWS SES
                     action_type = 'EXECUTED'
-                    email_log = self._send_email(
+                    email_log = emailer.send(
                         to=customer_email,
                         subject=response.get('response_subject'),
                         body=response.get('response_body')
                     )
                     
-                    # Update inquiry status
-                    inquiries_df.loc[inquiries_df['inquiry_id'] == inquiry_id, 'status'] = 'responded'
-                    inquiries_df.to_csv('data/customer_inquiries.csv', index=False)
+                    # Queue the status change - applied in one pass after the loop
+                    responded.append(inquiry_id)
                 
                 result = {
                     'action_type': 'customer_response',
@@ -217,70 +493,95 @@ class ActionExecutor:
                     'strategy': response.get('strategy'),
                     'execution_type': action_type,
                     'email_log': email_log,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': ts
                 }
                 
                 results.append(result)
+                success_count += 1
                 
-                print(f"{'📧' if not self.dry_run else '💭'} Email {'sent' if not self.dry_run else 'simulation'}: {customer_name} - {response.get('response_subject')}")
+                logger.info(f"{'📧' if not self.dry_run else '💭'} Email {'sent' if not self.dry_run else 'simulation'}: {customer_name} - {response.get('response_subject')}")
                 
             except Exception as e:
                 results.append({
                     'inquiry_id': response.get('inquiry_id'),
                     'status': 'failed',
                     'error': str(e),
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': ts
                 })
-        
-        return results
-    
-    def execute_social_media_posts(self, posts: List[Dict]) -> List[Dict]:
+
+        if emailer:
+            emailer.close()
+
+        # Mark all responded inquiries in one vectorized pass, then one CSV rewrite
+        if responded:
+            inquiries_df.loc[inquiries_df['inquiry_id'].isin(responded), 'status'] = 'responded'
+            _atomic_to_csv(inquiries_df, 'data/customer_inquiries.csv')
+
+        return results, success_count
+
+    def execute_social_media_posts(self, posts: List[Dict], ts: str = None) -> Tuple[List[Dict], int]:
         """Create social media posts"""
-        
+
+        ts = ts or datetime.now().isoformat()
         results = []
-        
+        success_count = 0
+
+        # One buffered append-only log handle for the whole batch
+        social_log_fh = None
+        if not self.dry_run and posts:
+            day = ts[:10].replace('-', '')
+            social_log_fh = open(f"logs/social/{day}.jsonl", 'a', buffering=1 << 16)
+
         for post in posts:
             try:
                 platform = post.get('platform')
                 content = post.get('content')
                 vehicle_vin = post.get('vehicle_vin')
-                
+
+                # Slice once; the original slice is reused on both branches
+                preview = content[:100]
+
                 if self.dry_run:
                     action_type = 'SIMULATED'
                 else:
                     # In production, this would post to actual social media APIs
                     action_type = 'EXECUTED'
                     # For demo, save to file
-                    self._save_social_post(platform, content, vehicle_vin)
+                    self._save_social_post(social_log_fh, ts, platform, content, vehicle_vin)
                 
                 result = {
                     'action_type': 'social_media_post',
                     'status': 'success',
                     'platform': platform,
-                    'content_preview': content[:100] + '...' if len(content) > 100 else content,
+                    'content_preview': preview + _ELLIPSIS if len(content) > 100 else preview,
                     'vehicle_vin': vehicle_vin,
                     'hashtags': post.get('hashtags', []),
                     'execution_type': action_type,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': ts
                 }
                 
                 results.append(result)
+                success_count += 1
                 
-                print(f"{'📱' if not self.dry_run else '💭'} Social post {'created' if not self.dry_run else 'simulation'}: {platform} - {content[:50]}...")
+                logger.info(f"{'📱' if not self.dry_run else '💭'} Social post {'created' if not self.dry_run else 'simulation'}: {platform} - {content[:50]}...")
                 
             except Exception as e:
                 results.append({
                     'platform': post.get('platform'),
                     'status': 'failed',
                     'error': str(e),
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': ts
                 })
-        
-        return results
-    
-    def log_urgent_alerts(self, alerts: List[Dict]) -> List[Dict]:
+
+        if social_log_fh:
+            social_log_fh.close()
+
+        return results, success_count
+
+    def log_urgent_alerts(self, alerts: List[Dict], ts: str = None) -> List[Dict]:
         """Log urgent items that need human attention"""
-        
+
+        ts = ts or datetime.now().isoformat()
         results = []
         
         for alert in alerts:
@@ -291,82 +592,90 @@ class ActionExecutor:
                 'category': alert.get('category'),
                 'message': alert.get('message'),
                 'recommended_action': alert.get('recommended_action'),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': ts
             }
             
             results.append(result)
             
             priority_emoji = '🚨' if alert.get('priority') == 'high' else '⚠️' if alert.get('priority') == 'medium' else 'ℹ️'
-            print(f"{priority_emoji} Alert [{alert.get('priority')}]: {alert.get('message')}")
+            logger.info(f"{priority_emoji} Alert [{alert.get('priority')}]: {alert.get('message')}")
         
         return results
     
-    def _send_email(self, to: str, subject: str, body: str) -> Dict:
-        """Send actual email (placeholder for demo)"""
-        
-        # In production, use SendGrid, AWS SES, or SMTP
-        # For demo, we just log it
-        
-        email_log = {
-            'sent': True,
-            'to': to,
-            'subject': subject,
-            'timestamp': datetime.now().isoformat(),
-            'method': 'demo_mode'
-        }
-        
-        # Save to file for demo purposes
-        os.makedirs('logs/emails', exist_ok=True)
-        filename = f"logs/emails/email_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-        
-        with open(filename, 'w') as f:
-            f.write(f"To: {to}\n")
-            f.write(f"Subject: {subject}\n")
-            f.write(f"Timestamp: {datetime.now().isoformat()}\n")
-            f.write(f"\n{body}\n")
-        
-        return email_log
-    
-    def _save_social_post(self, platform: str, content: str, vehicle_vin: str):
+    def _save_social_post(self, log_fh, ts: str, platform: str, content: str, vehicle_vin: str):
         """Save social media post for demo"""
-        
-        os.makedirs('logs/social', exist_ok=True)
-        filename = f"logs/social/{platform}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-        
-        with open(filename, 'w') as f:
-            f.write(f"Platform: {platform}\n")
-            f.write(f"Vehicle VIN: {vehicle_vin}\n")
-            f.write(f"Timestamp: {datetime.now().isoformat()}\n")
-            f.write(f"\n{content}\n")
+
+        log_fh.write(json.dumps({
+            'platform': platform,
+            'vehicle_vin': vehicle_vin,
+            'timestamp': ts,
+            'content': content
+        }) + "\n")
     
+    def _push_feed_entries(self, results: Dict):
+        """Fold one run's actions into the recent-actions ring buffer"""
+
+        ts = results.get('timestamp')
+        entries = [
+            _feed_entry(action, action_type, ts)
+            for action_type, actions in results.get('actions_by_type', {}).items()
+            if isinstance(actions, list)  # summary-only mode logs counts
+            for action in actions
+        ]
+
+        # Newest run first, original order preserved within the run
+        self.recent_actions.extendleft(reversed(entries))
+
+    def get_recent_actions(self):
+        """The precomputed activity feed, seeded from the log on first use"""
+
+        if not self.recent_actions:
+            for run in self.get_action_history(limit=20):
+                self._push_feed_entries(run)
+
+        return list(self.recent_actions)
+
     def _save_action_log(self, results: Dict):
-        """Save action log to file"""
-        
-        # Load existing logs
-        if os.path.exists(self.log_file):
-            with open(self.log_file, 'r') as f:
-                logs = json.load(f)
-        else:
-            logs = []
-        
-        # Append new results
-        logs.append(results)
-        
-        # Keep only last 100 logs
-        logs = logs[-100:]
-        
-        # Save
-        with open(self.log_file, 'w') as f:
-            json.dump(logs, f, indent=2)
-    
+        """Append one run record to the JSONL action log"""
+
+        self._push_feed_entries(results)
+
+        # Store the per-category result lists column-wise; readers get the
+        # row-wise view back from get_action_history
+        record = dict(results)
+        record['actions_by_type'] = {
+            name: _to_soa(actions)
+            for name, actions in results.get('actions_by_type', {}).items()
+        }
+
+        # Lazy rotation instead of rewriting the whole file every cycle
+        if os.path.exists(self.log_file) and os.path.getsize(self.log_file) > self.max_log_bytes:
+            os.replace(self.log_file, self.log_file + '.1')
+
+        with open(self.log_file, 'ab', buffering=1 << 16) as f:
+            f.write(_dumps_line(record))
+
     def get_action_history(self, limit=50):
         """Retrieve action history"""
-        
+
         if os.path.exists(self.log_file):
-            with open(self.log_file, 'r') as f:
-                logs = json.load(f)
-                return logs[-limit:]
-        
+            # Constant-time tail read - independent of how big the log grows
+            runs = [_loads(line) for line in _tail_lines(self.log_file, limit)]
+
+            for run in runs:
+                if 'actions_by_type' in run:
+                    run['actions_by_type'] = {
+                        name: _from_soa(actions)
+                        for name, actions in run['actions_by_type'].items()
+                    }
+
+            return runs
+
+        # Fall back to the pre-JSONL log format if one is still around
+        if os.path.exists(self.legacy_log_file):
+            with open(self.legacy_log_file, 'r') as f:
+                return json.load(f)[-limit:]
+
         return []
 
 # Test the executor
@@ -374,12 +683,13 @@ if __name__ == "__main__":
     print("🎬 Testing Action Executor...\n")
     
     from bedrock_agent import BedrockAgentCore
+    from autonomous_scheduler import READ_OPTS
     import pandas as pd
-    
+
     # Load data
-    inventory = pd.read_csv('data/inventory.csv')
-    competitors = pd.read_csv('data/competitors.csv')
-    inquiries = pd.read_csv('data/customer_inquiries.csv')
+    inventory = pd.read_csv('data/inventory.csv', **READ_OPTS['inventory.csv'])
+    competitors = pd.read_csv('data/competitors.csv', **READ_OPTS['competitors.csv'])
+    inquiries = pd.read_csv('data/customer_inquiries.csv', **READ_OPTS['customer_inquiries.csv'])
     
     # Run agent to get decisions
     agent = BedrockAgentCore()
@@ -1,6 +1,7 @@
 import schedule
 import time
 from datetime import datetime
+import numpy as np
 import pandas as pd
 from bedrock_agent import BedrockAgentCore
 from action_executor import ActionExecutor
@@ -9,6 +10,32 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Explicit dtypes let the C parser skip type inference on every read.
+# Inventory and inquiries are written back in full by the executor, so they
+# keep all columns; competitors is read-only and the agent only needs a few.
+INVENTORY_DTYPES = {
+    'year': 'int16',
+    'mileage': 'int32',
+    'cost': 'float32',
+    'current_price': 'float32',
+    'msrp': 'float32',
+    'days_in_inventory': 'int16',
+    'popularity_score': 'float32',
+    'view_count': 'int32',
+    'inquiry_count': 'int16'
+}
+
+COMPETITOR_COLS = ['make', 'model', 'year', 'price']
+COMPETITOR_DTYPES = {'year': 'int16', 'price': 'float32'}
+
+INQUIRY_DTYPES = {'budget_max': 'float32'}
+
+READ_OPTS = {
+    'inventory.csv': {'dtype': INVENTORY_DTYPES, 'engine': 'c'},
+    'competitors.csv': {'usecols': COMPETITOR_COLS, 'dtype': COMPETITOR_DTYPES, 'engine': 'c'},
+    'customer_inquiries.csv': {'dtype': INQUIRY_DTYPES, 'engine': 'c'}
+}
+
 class AutonomousAgent:
     """
     Autonomous agent that runs on a schedule
@@ -21,7 +48,21 @@ class AutonomousAgent:
         self.is_running = False
         self.run_count = 0
         self.last_run = None
-        
+        self._cache = {}  # path -> (mtime, DataFrame)
+
+    def _load(self, path):
+        """Load a CSV, reusing the cached DataFrame if the file is unchanged"""
+
+        mtime = os.path.getmtime(path)
+        cached = self._cache.get(path)
+
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        df = pd.read_csv(path, **READ_OPTS.get(os.path.basename(path), {}))
+        self._cache[path] = (mtime, df)
+        return df
+
     def run_agent_cycle(self):
         """Execute one complete agent cycle"""
         
@@ -33,13 +74,16 @@ class AutonomousAgent:
         try:
             # Load latest data
             print("📊 Loading data...")
-            inventory = pd.read_csv('../data/inventory.csv')
-            competitors = pd.read_csv('../data/competitors.csv')
-            inquiries = pd.read_csv('../data/customer_inquiries.csv')
+            inventory = self._load('../data/inventory.csv')
+            competitors = self._load('../data/competitors.csv')
+            inquiries = self._load('../data/customer_inquiries.csv')
             
+            # Count without materializing a filtered copy of the frame
+            new_count = int(np.count_nonzero(inquiries['status'].values == 'new'))
+
             print(f"   • Inventory: {len(inventory)} vehicles")
             print(f"   • Competitors: {len(competitors)} listings")
-            print(f"   • Inquiries: {len(inquiries[inquiries['status'] == 'new'])} new")
+            print(f"   • Inquiries: {new_count} new")
             
             # Run agent decision-making
             print("\n🧠 Agent analyzing situation and making decisions...")
@@ -103,10 +147,11 @@ class AutonomousAgent:
         # Schedule future runs
         schedule.every(interval_minutes).minutes.do(self.run_agent_cycle)
         
-        # Keep running
+        # Sleep until the next scheduled run instead of polling every second
         while self.is_running:
+            idle = schedule.idle_seconds()
+            time.sleep(max(0, min(idle if idle is not None else 1, 60)))
             schedule.run_pending()
-            time.sleep(1)
     
     def stop(self):
         """Stop the autonomous agent"""
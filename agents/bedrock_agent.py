@@ -1,13 +1,154 @@
+import asyncio
 import boto3
 import json
 import os
+import weakref
+
+try:
+    import aioboto3
+except ImportError:
+    aioboto3 = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+from botocore.config import Config
 from dotenv import load_dotenv
 from datetime import datetime
+from typing import List, Optional, TypedDict
 import pandas as pd
-import json
 
 load_dotenv()
 
+# Tuned transport: the default client has a 10-connection pool, no TCP
+# keep-alive and standard retries - under concurrent dashboard traffic that
+# means connection churn and throttling-induced stalls
+_BEDROCK_CONFIG = Config(
+    retries={'mode': 'adaptive', 'max_attempts': 5},
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=120
+)
+
+_bedrock_client = None
+
+def get_bedrock_client():
+    """Process-wide Bedrock runtime client (shared pool and TLS sessions)"""
+
+    global _bedrock_client
+    if _bedrock_client is None:
+        _bedrock_client = boto3.client(
+            service_name='bedrock-runtime',
+            region_name=os.getenv('AWS_REGION', 'us-east-1'),
+            config=_BEDROCK_CONFIG
+        )
+    return _bedrock_client
+
+# Known shape of the decision JSON. msgspec compiles a decoder specialized
+# to this schema, so parse and type validation happen in a single C pass.
+# total=False: the model may omit sections, and unknown keys are ignored.
+class _PriceAdjustment(TypedDict, total=False):
+    vin: str
+    stock_number: str
+    current_price: float
+    recommended_price: float
+    reason: str
+    confidence: float
+    urgency: str
+
+class _CustomerResponse(TypedDict, total=False):
+    inquiry_id: str
+    customer_name: str
+    response_subject: str
+    response_body: str
+    offer_price: Optional[float]
+    strategy: str
+
+class _Decisions(TypedDict, total=False):
+    analysis_summary: str
+    price_adjustments: List[_PriceAdjustment]
+    customer_responses: List[_CustomerResponse]
+    social_media_posts: List[dict]
+    urgent_alerts: List[dict]
+
+# The same shape as a Converse tool schema. Forcing the model to "call"
+# emit_decisions replaces the ~400-token JSON example in the prompt and
+# guarantees structurally valid output - no text extraction needed.
+_DECISION_TOOL_CONFIG = {
+    'tools': [{
+        'toolSpec': {
+            'name': 'emit_decisions',
+            'description': 'Record the decisions for this cycle',
+            'inputSchema': {'json': {
+                'type': 'object',
+                'properties': {
+                    'analysis_summary': {
+                        'type': 'string',
+                        'description': '2-3 sentence summary of current situation'
+                    },
+                    'price_adjustments': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'object',
+                            'properties': {
+                                'vin': {'type': 'string', 'description': 'EXACT VIN from the data'},
+                                'stock_number': {'type': 'string', 'description': 'EXACT stock_number from the data'},
+                                'current_price': {'type': 'number'},
+                                'recommended_price': {'type': 'number'},
+                                'reason': {'type': 'string'},
+                                'confidence': {'type': 'number'},
+                                'urgency': {'type': 'string'}
+                            },
+                            'required': ['vin', 'stock_number', 'current_price', 'recommended_price']
+                        }
+                    },
+                    'customer_responses': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'object',
+                            'properties': {
+                                'inquiry_id': {'type': 'string', 'description': 'EXACT inquiry_id from the data'},
+                                'customer_name': {'type': 'string'},
+                                'response_subject': {'type': 'string'},
+                                'response_body': {'type': 'string'},
+                                'offer_price': {'type': ['number', 'null']},
+                                'strategy': {'type': 'string'}
+                            },
+                            'required': ['inquiry_id', 'response_subject', 'response_body']
+                        }
+                    },
+                    'social_media_posts': {'type': 'array', 'items': {'type': 'object'}},
+                    'urgent_alerts': {'type': 'array', 'items': {'type': 'object'}}
+                },
+                'required': ['analysis_summary', 'price_adjustments', 'customer_responses']
+            }}
+        }
+    }],
+    'toolChoice': {'tool': {'name': 'emit_decisions'}}
+}
+
+def _dumps_indent(obj):
+    """Indented JSON for prompt context (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+    return json.dumps(obj, indent=2)
+
+def _loads(text):
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
 class BedrockAgentCore:
     """
     Core agentic AI system using AWS Bedrock Claude
@@ -15,127 +156,221 @@ class BedrockAgentCore:
     """
     
     def __init__(self):
-        self.bedrock = boto3.client(
-            service_name='bedrock-runtime',
-            region_name=os.getenv('AWS_REGION', 'us-east-1')
-        )
-        self.model_id = os.getenv('BEDROCK_MODEL_ID')
+        self.bedrock = get_bedrock_client()
+        self.model_id = self._with_inference_profile(os.getenv('BEDROCK_MODEL_ID'))
+        # Cheaper, ~4x faster model for templated tasks (marketing copy,
+        # negotiation drafts); the heavyweight model stays on the planning loop
+        self.fast_model_id = self._with_inference_profile(os.getenv(
+            'BEDROCK_FAST_MODEL_ID',
+            'anthropic.claude-3-5-haiku-20241022-v1:0'
+        ))
         self.dealer_name = os.getenv('DEALER_NAME', 'Premium Auto Sales')
         self.min_margin = float(os.getenv('MIN_PROFIT_MARGIN', 0.05))
         self.max_adjustment = float(os.getenv('MAX_PRICE_ADJUSTMENT', 0.15))
-        
-    def invoke_claude(self, messages, max_tokens=4000, temperature=0.7):
-        """Call AWS Bedrock Claude model"""
-        
-        request_body = {
-            "anthropic_version": "bedrock-2023-05-31",
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-            "messages": messages
-        }
-        
-        try:
-            response = self.bedrock.invoke_model(
-                modelId=self.model_id,
-                body=json.dumps(request_body)
-            )
-            
-            response_body = json.loads(response['body'].read())
-            return response_body['content'][0]['text']
-            
-        except Exception as e:
-            print(f"❌ Bedrock error: {e}")
-            return None
-    
-    def agent_decision_loop(self, inventory_df, competitor_df, inquiries_df):
+
+        # Latency-optimized inference is only offered for a handful of
+        # model/region combinations and Bedrock rejects the call outright
+        # everywhere else, so it stays opt-in
+        self.latency_optimized = os.getenv(
+            'BEDROCK_LATENCY_OPTIMIZED', ''
+        ).lower() in ('1', 'true', 'yes')
+
+        # Everything that never changes between decision runs lives in the
+        # system prefix so Bedrock prompt caching can reuse it - only the
+        # inventory/inquiry data is paid for on every call
+        self.decision_system = self._build_decision_system()
+
+        # Reused SIMD parser for the model's JSON replies (None -> _loads)
+        self._json_parser = simdjson.Parser() if simdjson is not None else None
+
+        # (id(df), column) -> (weakref, frozenset); see _cached_id_set
+        self._set_cache = {}
+
+    @staticmethod
+    def _with_inference_profile(model_id):
+        """Route bare model IDs through a cross-region inference profile
+
+        Profile-prefixed IDs (us. / eu. / apac. / global.) let Bedrock send
+        each call to whichever region has capacity, instead of queueing
+        behind a single region's TPM/RPM quota. IDs that already carry a
+        prefix, and full ARNs, pass through unchanged. The prefix defaults
+        to 'us.' and can be overridden via BEDROCK_INFERENCE_PROFILE_PREFIX.
         """
-        🤖 THE MAIN AGENTIC LOOP
+
+        if not model_id or model_id.startswith(
+            ('us.', 'eu.', 'apac.', 'global.', 'arn:')
+        ):
+            return model_id
+
+        return os.getenv('BEDROCK_INFERENCE_PROFILE_PREFIX', 'us.') + model_id
+
+    def _build_decision_system(self):
+        """Static system prompt for the decision loop (cached by Bedrock)
+
+        The output structure lives in the emit_decisions tool schema, not
+        here - the old inline JSON example cost ~400 input tokens per call.
         """
-        
-        # Prepare context for Claude
-        context = self._prepare_decision_context(inventory_df, competitor_df, inquiries_df)
-        
-        # Ask Claude to make decisions
-        prompt = f"""You are an autonomous AI agent managing a car dealership called {self.dealer_name}.
 
-    {context}
+        return f"""You are an autonomous AI agent managing a car dealership called {self.dealer_name}.
 
     YOUR TASK:
-    Analyze the aged vehicles and customer inquiries above and make specific recommendations.
+    Analyze the aged vehicles and customer inquiries provided by the user and record your recommendations by calling the emit_decisions tool.
 
     CRITICAL RULES:
-    1. You MUST use EXACT VINs and stock numbers from the data I provided above
-    2. You MUST use EXACT inquiry_ids from the customer inquiries above
-    3. Do NOT invent or generate fake IDs
-    4. Only recommend price changes that maintain minimum {self.min_margin*100}% profit margin
-    5. Maximum price change: ±{self.max_adjustment*100}%
+    1. Use ONLY the EXACT VINs, stock numbers and inquiry_ids from the data provided - never invent IDs
+    2. Only recommend price changes that maintain minimum {self.min_margin*100}% profit margin
+    3. Maximum price change: ±{self.max_adjustment*100}%
 
     DECISION FRAMEWORK:
     - Vehicles > 60 days: Recommend 5-10% price reduction (if margin allows)
     - Hot leads: Draft immediate response
     - Price shoppers: Provide value justification
 
-    Respond with ONLY this JSON structure (no markdown, no explanations):
+    Generate 3-5 price adjustments for the most aged vehicles and 2-3 customer responses."""
 
-    {{
-    "analysis_summary": "2-3 sentence summary of current situation",
-    "price_adjustments": [
-        {{
-        "vin": "EXACT VIN from above data",
-        "stock_number": "EXACT stock_number from above",
-        "current_price": current price as number,
-        "recommended_price": new price as number,
-        "reason": "brief explanation",
-        "confidence": 0.85,
-        "urgency": "high"
-        }}
-    ],
-    "customer_responses": [
-        {{
-        "inquiry_id": "EXACT inquiry_id from above",
-        "customer_name": "name from data",
-        "response_subject": "subject line",
-        "response_body": "email content",
-        "offer_price": null,
-        "strategy": "approach explanation"
-        }}
-    ],
-    "social_media_posts": [],
-    "urgent_alerts": []
-    }}
-
-    Generate 3-5 price adjustments for the most aged vehicles and 2-3 customer responses.
-    Remember: Use ONLY the exact VINs and IDs from the data above."""
+    def _converse_kwargs(self, messages, max_tokens, temperature, system, model_id=None, tool_config=None):
+        """Build the shared request dict for converse / converse_stream"""
 
-        messages = [{"role": "user", "content": prompt}]
+        # Converse expects content as a list of blocks
+        converse_messages = [
+            {
+                'role': m['role'],
+                'content': m['content'] if isinstance(m['content'], list) else [{'text': m['content']}]
+            }
+            for m in messages
+        ]
+
+        kwargs = {
+            'modelId': model_id or self.model_id,
+            'messages': converse_messages,
+            'inferenceConfig': {'maxTokens': max_tokens, 'temperature': temperature}
+        }
+
+        if self.latency_optimized:
+            kwargs['performanceConfig'] = {'latency': 'optimized'}
+
+        if system:
+            # Cache point after the static prefix: repeated runs skip
+            # re-processing the rules and schema
+            kwargs['system'] = [{'text': system}, {'cachePoint': {'type': 'default'}}]
+
+        if tool_config:
+            kwargs['toolConfig'] = tool_config
+
+        return kwargs
+
+    def invoke_claude_stream(self, messages, max_tokens=4000, temperature=0.7, system=None, model_id=None):
+        """Stream Claude's response token-by-token via ConverseStream"""
+
+        kwargs = self._converse_kwargs(messages, max_tokens, temperature, system, model_id=model_id)
+
+        try:
+            response = self.bedrock.converse_stream(**kwargs)
+
+            for event in response['stream']:
+                if 'contentBlockDelta' in event:
+                    delta = event['contentBlockDelta']['delta']
+                    if 'text' in delta:
+                        yield delta['text']
+
+                elif 'metadata' in event:
+                    usage = event['metadata'].get('usage', {})
+                    cache_read = usage.get('cacheReadInputTokens', 0)
+                    if cache_read:
+                        print(f"⚡ Prompt cache hit: {cache_read} tokens read from cache")
+
+        except Exception as e:
+            print(f"❌ Bedrock error: {e}")
+
+    def invoke_claude(self, messages, max_tokens=4000, temperature=0.7, system=None, model_id=None):
+        """Call AWS Bedrock Claude and return the full response text
+
+        Internally consumes the event stream so generation overlaps with
+        network transfer instead of blocking on the complete body.
+        """
+
+        chunks = list(self.invoke_claude_stream(messages, max_tokens, temperature, system, model_id=model_id))
+
+        if not chunks:
+            return None
+
+        return ''.join(chunks)
+    
+    def _invoke_decision_tool(self, context):
+        """One forced emit_decisions call; returns the tool input dict"""
+
+        kwargs = self._converse_kwargs(
+            [{"role": "user", "content": context}],
+            max_tokens=4000, temperature=0.7,
+            system=self.decision_system,
+            tool_config=_DECISION_TOOL_CONFIG
+        )
+
+        response = self.bedrock.converse(**kwargs)
+
+        cache_read = response.get('usage', {}).get('cacheReadInputTokens', 0)
+        if cache_read:
+            print(f"⚡ Prompt cache hit: {cache_read} tokens read from cache")
+
+        for block in response['output']['message']['content']:
+            if 'toolUse' in block:
+                return block['toolUse']['input']
+
+        return None
+
+    def agent_decision_loop(self, inventory_df, competitor_df, inquiries_df):
+        """
+        🤖 THE MAIN AGENTIC LOOP
+        """
         
+        # Prepare context for Claude - only this dynamic part misses the cache
+        context = self._prepare_decision_context(inventory_df, competitor_df, inquiries_df)
+
         try:
-            response = self.invoke_claude(messages, max_tokens=4000, temperature=0.7)
-            
-            if not response:
-                print("⚠️ No response from Claude")
-                return self._generate_fallback_decisions(inventory_df, inquiries_df)
-            
-            # Try to parse JSON
-            try:
-                json_text = self._extract_json(response)
-                decisions = json.loads(json_text)
-                
-                # Validate that VINs exist
-                valid_vins = set(inventory_df['vin'].values)
-                valid_decisions = self._validate_decisions(decisions, valid_vins, set(inquiries_df['inquiry_id'].values))
-                
-                print("✅ Successfully parsed and validated JSON decisions")
-                return valid_decisions
-                
-            except json.JSONDecodeError as e:
-                print(f"❌ JSON parsing failed: {e}")
+            # Forced tool use: the toolUse input arrives as an already-parsed
+            # dict matching the emit_decisions schema - no text extraction
+            decisions = self._invoke_decision_tool(context)
+
+            if decisions is None:
+                print("⚠️ No tool output from Claude")
                 return self._generate_fallback_decisions(inventory_df, inquiries_df)
-        
+
+            if msgspec is not None:
+                # Bedrock enforces the schema loosely; re-check field types
+                # against the same shape in one C pass
+                decisions = msgspec.convert(decisions, _Decisions)
+
+            # Validate that VINs exist
+            valid_vins = self._cached_id_set(inventory_df, 'vin')
+            valid_inquiry_ids = self._cached_id_set(inquiries_df, 'inquiry_id')
+            valid_decisions = self._validate_decisions(decisions, valid_vins, valid_inquiry_ids)
+
+            print("✅ Successfully validated agent decisions")
+            return valid_decisions
+
         except Exception as e:
             print(f"❌ Error in agent loop: {e}")
             return self._generate_fallback_decisions(inventory_df, inquiries_df)
 
+    def _cached_id_set(self, df, column):
+        """frozenset of a column's values, cached per DataFrame object
+
+        Callers hold DataFrames in mtime-keyed caches, so the same object
+        arrives on every decision cycle until the data file changes.
+        Keying on object identity (with a weakref guard against id reuse)
+        skips rebuilding the set on each run.
+        """
+
+        key = (id(df), column)
+        cached = self._set_cache.get(key)
+
+        if cached is not None and cached[0]() is df:
+            return cached[1]
+
+        values = frozenset(df[column].to_numpy())
+        self._set_cache[key] = (weakref.ref(df), values)
+        return values
+
     def _validate_decisions(self, decisions, valid_vins, valid_inquiry_ids):
         """Validate and filter decisions to only include real IDs"""
         
@@ -171,7 +406,9 @@ class BedrockAgentCore:
         hot_inventory = inventory_df[inventory_df['days_in_inventory'] < 30]
         
         # Competitor pricing
-        comp_summary = competitor_df.groupby(['make', 'model'])['price'].agg(['mean', 'min', 'max']).reset_index()
+        # observed=True keeps categorical keys from expanding to the full
+        # category product when callers pass down-cast frames
+        comp_summary = competitor_df.groupby(['make', 'model'], observed=True)['price'].agg(['mean', 'min', 'max']).reset_index()
         
         # New inquiries
         new_inquiries = inquiries_df[inquiries_df['status'] == 'new']
@@ -194,10 +431,10 @@ class BedrockAgentCore:
     - Average days in stock: {inventory_df['days_in_inventory'].mean():.1f}
 
     TOP AGED VEHICLES (MUST USE EXACT VINs & STOCK NUMBERS):
-    {json.dumps(aged_for_context, indent=2)}
+    {_dumps_indent(aged_for_context)}
 
     CUSTOMER INQUIRIES (MUST USE EXACT inquiry_id):
-    {json.dumps(inquiries_for_context, indent=2)}
+    {_dumps_indent(inquiries_for_context)}
 
     CRITICAL: When making decisions, you MUST use the EXACT VINs, stock_numbers, and inquiry_ids from above.
     Do not generate fake IDs - only use the real ones I've provided.
@@ -205,18 +442,27 @@ class BedrockAgentCore:
     
         return context
     
+    def _parse_json(self, text):
+        """Decode a JSON document with the fastest parser available"""
+
+        if self._json_parser is not None:
+            # simdjson scans structural characters with SIMD; as_dict
+            # detaches the result from the parser's reusable buffer
+            return self._json_parser.parse(text.encode()).as_dict()
+
+        return _loads(text)
+
     def _extract_json(self, text):
-        """Extract JSON from markdown or mixed text"""
-        # Remove markdown code blocks if present
-        text = text.replace('```json', '').replace('```', '').strip()
-        
-        # Find JSON object
+        """Extract the JSON object span from markdown or mixed text"""
+
+        # Fences and prose never contain braces, so a single brace-span
+        # slice replaces the old strip-fences-then-search triple copy
         start = text.find('{')
-        end = text.rfind('}') + 1
-        
+        end = text.rfind('}')
+
         if start != -1 and end > start:
-            return text[start:end]
-        
+            return text[start:end + 1]
+
         return text
     
     def generate_vehicle_description(self, vehicle):
@@ -244,11 +490,11 @@ class BedrockAgentCore:
         Write ONLY the description, no preamble."""
 
         messages = [{"role": "user", "content": prompt}]
-        return self.invoke_claude(messages, max_tokens=500, temperature=0.8)
+        return self.invoke_claude(messages, max_tokens=500, temperature=0.8, model_id=self.fast_model_id)
     
-    def negotiate_with_customer(self, inquiry, vehicle, competitor_avg_price):
-        """Generate personalized negotiation response"""
-        
+    def _negotiation_prompt(self, inquiry, vehicle, competitor_avg_price):
+        """Build the negotiation prompt shared by the sync and async paths"""
+
         # Calculate our position
         margin = ((vehicle['current_price'] - vehicle['cost']) / vehicle['cost']) * 100
         vs_market = ((vehicle['current_price'] - competitor_avg_price) / competitor_avg_price) * 100
@@ -294,16 +540,78 @@ class BedrockAgentCore:
         "probability_of_close": 0.75
         }}"""
 
+        return prompt
+
+    def _parse_negotiation_response(self, response):
+        """Decode the negotiation JSON, keeping the raw text on failure"""
+
+        if not response:
+            return None
+
+        try:
+            return self._parse_json(self._extract_json(response))
+        except:
+            return {"email_body": response, "error": "Could not parse JSON"}
+
+    def negotiate_with_customer(self, inquiry, vehicle, competitor_avg_price):
+        """Generate personalized negotiation response"""
+
+        prompt = self._negotiation_prompt(inquiry, vehicle, competitor_avg_price)
+
         messages = [{"role": "user", "content": prompt}]
-        response = self.invoke_claude(messages, max_tokens=1000, temperature=0.7)
-        
-        if response:
-            try:
-                return json.loads(self._extract_json(response))
-            except:
-                return {"email_body": response, "error": "Could not parse JSON"}
-        
-        return None
+        response = self.invoke_claude(messages, max_tokens=1000, temperature=0.7, model_id=self.fast_model_id)
+
+        return self._parse_negotiation_response(response)
+
+    async def _anegotiate(self, client, inquiry, vehicle, competitor_avg_price):
+        """One async negotiation call against a shared Bedrock client"""
+
+        prompt = self._negotiation_prompt(inquiry, vehicle, competitor_avg_price)
+        kwargs = self._converse_kwargs(
+            [{"role": "user", "content": prompt}],
+            max_tokens=1000, temperature=0.7, system=None,
+            model_id=self.fast_model_id
+        )
+
+        try:
+            response = await client.converse(**kwargs)
+            text = response['output']['message']['content'][0]['text']
+        except Exception as e:
+            print(f"❌ Bedrock error: {e}")
+            return None
+
+        return self._parse_negotiation_response(text)
+
+    async def anegotiate_batch(self, items, max_concurrency=8):
+        """Negotiate all inquiries concurrently instead of one round-trip at a time
+
+        Args:
+            items: list of (inquiry, vehicle, competitor_avg_price) tuples
+            max_concurrency: cap on in-flight Bedrock requests (quota-friendly)
+        """
+
+        if aioboto3 is None:
+            # No async client available - fall back to the serial path
+            return [self.negotiate_with_customer(*item) for item in items]
+
+        session = aioboto3.Session()
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async with session.client(
+            'bedrock-runtime',
+            region_name=os.getenv('AWS_REGION', 'us-east-1')
+        ) as client:
+
+            async def bounded(item):
+                async with sem:
+                    return await self._anegotiate(client, *item)
+
+            return await asyncio.gather(*(bounded(item) for item in items))
+
+    def negotiate_batch(self, items, max_concurrency=8):
+        """Sync entry point for anegotiate_batch (e.g. from Flask)"""
+
+        return asyncio.run(self.anegotiate_batch(items, max_concurrency=max_concurrency))
 
 # Test the agent
 if __name__ == "__main__":
@@ -321,6 +629,6 @@ if __name__ == "__main__":
     
     if decisions:
         print("\n✅ Agent decisions generated!")
-        print(json.dumps(decisions, indent=2))
+        print(_dumps_indent(decisions))
     else:
         print("\n❌ No decisions generated")
\ No newline at end of file
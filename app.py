@@ -1,57 +1,142 @@
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, render_template, jsonify, request, Response
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+import functools
 import pandas as pd
 import plotly.graph_objs as go
 import plotly.express as px
+import plotly.io as pio
 import json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from datetime import datetime, timedelta
 import os
 from agents.bedrock_agent import BedrockAgentCore
 from agents.action_executor import ActionExecutor
 
+class OrJSONProvider(JSONProvider):
+    """jsonify backed by orjson - much faster for the record-list payloads"""
+
+    def dumps(self, obj, **kwargs):
+        # OPT_SERIALIZE_NUMPY covers the NumPy scalars pandas hands back
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrJSONProvider(app)
 CORS(app)
 
 # Initialize AI components
 agent_core = BedrockAgentCore()
 executor = ActionExecutor(dry_run=True)
 
+# Down-cast on load: the groupby/merge/cut work below is memory-bandwidth
+# bound, so halving element width nearly doubles throughput. Low-cardinality
+# strings become categories (dictionary-encoded, like the Parquet siblings).
+CSV_DTYPES = {
+    'data/inventory.csv': {
+        'year': 'int16', 'mileage': 'int32', 'cost': 'float32',
+        'current_price': 'float32', 'msrp': 'float32',
+        'days_in_inventory': 'int16', 'popularity_score': 'float32',
+        'view_count': 'int32', 'inquiry_count': 'int16',
+        'make': 'category', 'model': 'category', 'color': 'category',
+        'condition': 'category', 'trim': 'category',
+        'transmission': 'category', 'fuel_type': 'category'
+    },
+    'data/competitors.csv': {
+        'year': 'int16', 'mileage': 'int32', 'price': 'float32',
+        'distance_miles': 'float32',
+        'make': 'category', 'model': 'category', 'dealer_name': 'category',
+        'condition': 'category', 'trim': 'category'
+    },
+    'data/customer_inquiries.csv': {
+        'budget_max': 'float32',
+        'customer_type': 'category', 'status': 'category',
+        'preferred_contact': 'category'
+    },
+    'data/sales_history.csv': {
+        'year': 'int16', 'original_price': 'float32', 'sold_price': 'float32',
+        'discount': 'float32', 'days_to_sell': 'int16',
+        'gross_profit': 'float32', 'make': 'category', 'season': 'category'
+    }
+}
+
+# Parsed DataFrames cached per path; refreshed only when the file changes
+_DF_CACHE = {}
+
+def get_df(path):
+    """Load a data file through the mtime-checked process-wide cache.
+
+    Prefers a Parquet sibling (see convert_to_parquet.py) when it is at
+    least as fresh as the CSV - columnar, typed, and far cheaper to load.
+    """
+
+    src = path
+    parquet = path.rsplit('.', 1)[0] + '.parquet'
+
+    if os.path.exists(parquet) and os.path.getmtime(parquet) >= os.path.getmtime(path):
+        src = parquet
+
+    mtime = os.path.getmtime(src)
+    cached = _DF_CACHE.get(path)
+
+    if cached and cached[0] == (src, mtime):
+        return cached[1]
+
+    if src.endswith('.parquet'):
+        df = pd.read_parquet(src, engine='pyarrow')
+    else:
+        df = pd.read_csv(src, dtype=CSV_DTYPES.get(path))
+
+    _DF_CACHE[path] = ((src, mtime), df)
+    return df
+
+def _mtimes(*paths):
+    """Cache key for derived artifacts: the mtimes of their source files"""
+    return tuple(os.path.getmtime(path) for path in paths)
+
 def load_data():
     """Load all data files"""
     return {
-        'inventory': pd.read_csv('data/inventory.csv'),
-        'competitors': pd.read_csv('data/competitors.csv'),
-        'inquiries': pd.read_csv('data/customer_inquiries.csv'),
-        'sales': pd.read_csv('data/sales_history.csv')
+        'inventory': get_df('data/inventory.csv'),
+        'competitors': get_df('data/competitors.csv'),
+        'inquiries': get_df('data/customer_inquiries.csv'),
+        'sales': get_df('data/sales_history.csv')
+    }
+
+@functools.lru_cache(maxsize=8)
+def _kpis(mtime_key):
+    """Dashboard KPIs, recomputed only when the source files change"""
+
+    inventory = get_df('data/inventory.csv')
+    inquiries = get_df('data/customer_inquiries.csv')
+
+    return {
+        'total_inventory': len(inventory),
+        'total_value': inventory['current_price'].sum(),
+        'avg_days': round(inventory['days_in_inventory'].mean(), 1),
+        'aged_inventory': len(inventory[inventory['days_in_inventory'] > 60]),
+        'new_inquiries': len(inquiries[inquiries['status'] == 'new']),
+        'hot_leads': len(inquiries[inquiries['customer_type'] == 'hot_lead'])
     }
 
 @app.route('/')
 def dashboard():
     """Main dashboard"""
-    
-    data = load_data()
-    inventory = data['inventory']
-    inquiries = data['inquiries']
-    
-    # Calculate KPIs
-    total_inventory = len(inventory)
-    total_value = inventory['current_price'].sum()
-    avg_days = inventory['days_in_inventory'].mean()
-    aged_inventory = len(inventory[inventory['days_in_inventory'] > 60])
-    new_inquiries = len(inquiries[inquiries['status'] == 'new'])
-    hot_leads = len(inquiries[inquiries['customer_type'] == 'hot_lead'])
-    
+
+    kpis = _kpis(_mtimes('data/inventory.csv', 'data/customer_inquiries.csv'))
+
     # Get recent agent actions
     action_history = executor.get_action_history(limit=20)
-    
+
     return render_template('dashboard.html',
-                         total_inventory=total_inventory,
-                         total_value=total_value,
-                         avg_days=round(avg_days, 1),
-                         aged_inventory=aged_inventory,
-                         new_inquiries=new_inquiries,
-                         hot_leads=hot_leads,
-                         action_history=action_history)
+                         action_history=action_history,
+                         **kpis)
 
 @app.route('/api/agent-status')
 def agent_status():
@@ -77,69 +162,32 @@ def agent_status():
 def live_activity():
     """Get live activity feed"""
     
-    action_history = executor.get_action_history(limit=20)
-    
-    # Flatten all actions into a single feed
-    feed = []
-    
-    for run in reversed(action_history):
-        timestamp = run.get('timestamp')
-        
-        for action_type, actions in run.get('actions_by_type', {}).items():
-            for action in actions:
-                feed.append({
-                    'timestamp': action.get('timestamp', timestamp),
-                    'type': action.get('action_type', action_type),
-                    'status': action.get('status'),
-                    'description': format_action_description(action),
-                    'icon': get_action_icon(action.get('action_type', action_type))
-                })
-    
-    return jsonify(feed[:50])  # Return last 50 actions
+    # Entries are preformatted (description + icon) when actions execute;
+    # this is a plain copy of the executor's ring buffer
+    return jsonify(executor.get_recent_actions())
 
-def format_action_description(action):
-    """Format action for display"""
-    
-    action_type = action.get('action_type', '')
-    
-    if action_type == 'price_adjustment':
-        old = action.get('old_price', 0)
-        new = action.get('new_price', 0)
-        stock = action.get('stock_number', 'Unknown')
-        return f"Adjusted price on {stock}: ${old:,.0f} → ${new:,.0f}"
-    
-    elif action_type == 'customer_response':
-        name = action.get('customer_name', 'Customer')
-        subject = action.get('subject', 'inquiry')
-        return f"Responded to {name}: {subject}"
-    
-    elif action_type == 'social_media_post':
-        platform = action.get('platform', 'social media')
-        return f"Posted to {platform}"
-    
-    elif action_type == 'urgent_alert':
-        return f"Alert: {action.get('message', 'Action required')}"
-    
-    return "Action completed"
+@functools.lru_cache(maxsize=2)
+def _comp_avg(mtime_key):
+    """Average competitor price per (make, model, year), cached on mtime"""
 
-def get_action_icon(action_type):
-    """Get emoji icon for action type"""
-    
-    icons = {
-        'price_adjustment': '💰',
-        'customer_response': '📧',
-        'social_media_post': '📱',
-        'urgent_alert': '⚠️'
-    }
-    
-    return icons.get(action_type, '🤖')
+    competitors = get_df('data/competitors.csv')
+
+    # observed=True: with categorical keys the default would emit every
+    # category combination, not just the ones present in the data
+    comp_avg = (
+        competitors.groupby(['make', 'model', 'year'], observed=True)['price']
+        .mean().reset_index()
+    )
+    comp_avg.columns = ['make', 'model', 'year', 'comp_avg_price']
+    return comp_avg
+
+@functools.lru_cache(maxsize=8)
+def _age_chart(mtime_key):
+    """Inventory age chart payload, recomputed only when the data changes"""
+
+    # Shallow copy: the age_category column below must not leak into the cache
+    inventory = get_df('data/inventory.csv').copy(deep=False)
 
-@app.route('/api/inventory-analysis')
-def inventory_analysis():
-    """Inventory analysis charts"""
-    
-    inventory = pd.read_csv('data/inventory.csv')
-    
     # Age distribution
     age_bins = [0, 30, 60, 90, 150]
     age_labels = ['0-30 days', '31-60 days', '61-90 days', '90+ days']
@@ -167,26 +215,40 @@ def inventory_analysis():
         height=400
     )
     
-    return jsonify(json.loads(fig.to_json()))
+    # Serialize once; the cached string goes straight onto the wire
+    return pio.to_json(fig, validate=False)
 
-@app.route('/api/price-position')
-def price_position():
-    """Price vs market position"""
-    
-    inventory = pd.read_csv('data/inventory.csv')
-    competitors = pd.read_csv('data/competitors.csv')
-    
-    # Calculate average competitor prices
-    comp_avg = competitors.groupby(['make', 'model', 'year'])['price'].mean().reset_index()
-    comp_avg.columns = ['make', 'model', 'year', 'comp_avg_price']
+@app.route('/api/inventory-analysis')
+def inventory_analysis():
+    """Inventory analysis charts"""
+
+    return Response(_age_chart(_mtimes('data/inventory.csv')),
+                    mimetype='application/json')
+
+@functools.lru_cache(maxsize=8)
+def _price_position_chart(mtime_key):
+    """Price-vs-market chart payload, keyed by the two source mtimes"""
+
+    inventory = get_df('data/inventory.csv')
+    comp_avg = _comp_avg(_mtimes('data/competitors.csv'))
     
-    # Merge with inventory
-    inventory_with_comp = inventory.merge(comp_avg, on=['make', 'model', 'year'], how='left')
+    # Merge only the columns the plot needs - smaller hash-build side
+    plot_cols = ['make', 'model', 'year', 'current_price', 'days_in_inventory']
+    inventory_with_comp = inventory[plot_cols].merge(
+        comp_avg, on=['make', 'model', 'year'], how='left', copy=False
+    )
     inventory_with_comp['price_diff_pct'] = (
-        (inventory_with_comp['current_price'] - inventory_with_comp['comp_avg_price']) / 
+        (inventory_with_comp['current_price'] - inventory_with_comp['comp_avg_price']) /
         inventory_with_comp['comp_avg_price'] * 100
     )
-    
+
+    # Vectorized hovertext - no per-row Series boxing via iterrows
+    hover_text = (
+        inventory_with_comp['year'].astype(str) + ' ' +
+        inventory_with_comp['make'].astype(str) + ' ' +
+        inventory_with_comp['model'].astype(str)
+    ).tolist()
+
     fig = go.Figure(data=[
         go.Scatter(
             x=inventory_with_comp['days_in_inventory'],
@@ -199,7 +261,7 @@ def price_position():
                 showscale=True,
                 colorbar=dict(title="Days in Stock")
             ),
-            text=[f"{row['year']} {row['make']} {row['model']}" for _, row in inventory_with_comp.iterrows()],
+            text=hover_text,
             hovertemplate='%{text}<br>Price vs Market: %{y:.1f}%<br>Days: %{x}<extra></extra>'
         )
     ])
@@ -214,19 +276,24 @@ def price_position():
         height=400
     )
     
-    return jsonify(json.loads(fig.to_json()))
+    # Serialize once; the cached string goes straight onto the wire
+    return pio.to_json(fig, validate=False)
 
-@app.route('/api/top-opportunities')
-def top_opportunities():
-    """Get top opportunities for action"""
-    
-    inventory = pd.read_csv('data/inventory.csv')
-    competitors = pd.read_csv('data/competitors.csv')
+@app.route('/api/price-position')
+def price_position():
+    """Price vs market position"""
+
+    return Response(_price_position_chart(_mtimes('data/inventory.csv', 'data/competitors.csv')),
+                    mimetype='application/json')
+
+@functools.lru_cache(maxsize=8)
+def _top_opportunities(mtime_key):
+    """Top-opportunity records, keyed by the two source mtimes"""
+
+    inventory = get_df('data/inventory.csv')
+    comp_avg = _comp_avg(_mtimes('data/competitors.csv'))
     
     # Calculate opportunity score
-    comp_avg = competitors.groupby(['make', 'model', 'year'])['price'].mean().reset_index()
-    comp_avg.columns = ['make', 'model', 'year', 'comp_avg_price']
-    
     inventory_analysis = inventory.merge(comp_avg, on=['make', 'model', 'year'], how='left')
     inventory_analysis['price_vs_market'] = (
         (inventory_analysis['current_price'] - inventory_analysis['comp_avg_price']) / 
@@ -244,7 +311,13 @@ def top_opportunities():
         'comp_avg_price', 'days_in_inventory', 'opportunity_score'
     ]]
     
-    return jsonify(top_opps.to_dict('records'))
+    return top_opps.to_dict('records')
+
+@app.route('/api/top-opportunities')
+def top_opportunities():
+    """Get top opportunities for action"""
+
+    return jsonify(_top_opportunities(_mtimes('data/inventory.csv', 'data/competitors.csv')))
 
 @app.route('/api/run-agent', methods=['POST'])
 def run_agent_now():
@@ -279,17 +352,29 @@ def run_agent_now():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@functools.lru_cache(maxsize=2)
+def _vin_index(mtime_key):
+    """VIN -> positional row index, rebuilt only when inventory changes"""
+
+    inventory = get_df('data/inventory.csv')
+    return dict(zip(inventory['vin'].to_numpy(), range(len(inventory))))
+
+# The only fields the description prompt reads - no need to box a full row
+_DESCRIPTION_COLS = ['year', 'make', 'model', 'trim', 'mileage',
+                     'color', 'condition', 'current_price']
+
 @app.route('/api/generate-description/<vin>')
 def generate_description(vin):
     """Generate AI description for a vehicle"""
     
-    inventory = pd.read_csv('data/inventory.csv')
-    vehicle = inventory[inventory['vin'] == vin]
+    inventory = get_df('data/inventory.csv')
+    idx = _vin_index(_mtimes('data/inventory.csv')).get(vin)
     
-    if vehicle.empty:
+    if idx is None:
         return jsonify({'error': 'Vehicle not found'}), 404
     
-    vehicle_dict = vehicle.iloc[0].to_dict()
+    # Positional column access: no boolean mask scan, no Series boxing
+    vehicle_dict = {c: inventory[c].iat[idx] for c in _DESCRIPTION_COLS}
     description = agent_core.generate_vehicle_description(vehicle_dict)
     
     return jsonify({
@@ -302,7 +387,7 @@ def generate_description(vin):
 def customer_inquiries():
     """Get customer inquiries"""
     
-    inquiries = pd.read_csv('data/customer_inquiries.csv')
+    inquiries = get_df('data/customer_inquiries.csv')
     new_inquiries = inquiries[inquiries['status'] == 'new'].head(10)
     
     return jsonify(new_inquiries.to_dict('records'))
@@ -310,8 +395,35 @@ def customer_inquiries():
 @app.route('/api/full-inventory')
 def full_inventory():
     """Return full inventory data"""
-    inventory = pd.read_csv('data/inventory.csv')
-    return jsonify(inventory.to_dict('records'))
+    inventory = get_df('data/inventory.csv')
+
+    if orjson is None:
+        return jsonify(inventory.to_dict('records'))
+
+    cols = inventory.columns.tolist()
+
+    def gen():
+        # Stream the array in ~256-row chunks: O(chunk) memory instead of
+        # materializing every record dict plus the full JSON string, and
+        # the client starts parsing before the last row is encoded
+        opts = orjson.OPT_SERIALIZE_NUMPY
+        parts = []
+
+        for i, row in enumerate(inventory.itertuples(index=False, name=None)):
+            parts.append(orjson.dumps(dict(zip(cols, row)), option=opts).decode())
+            if len(parts) == 256:
+                yield (',' if i >= 256 else '[') + ','.join(parts)
+                parts = []
+
+        if parts:
+            yield ('[' if len(parts) == len(inventory) else ',') + ','.join(parts)
+            yield ']'
+        elif len(inventory):
+            yield ']'
+        else:
+            yield '[]'
+
+    return Response(gen(), mimetype='application/json')
 
 if __name__ == '__main__':
     app.run(debug=True, port=5000, host='0.0.0.0')
\ No newline at end of file
@@ -0,0 +1,35 @@
+"""
+One-shot conversion of the CSV data files to Parquet.
+
+The Flask app prefers a .parquet sibling when it is at least as fresh as
+the CSV, which skips text parsing and dtype inference on every load.
+Re-run this script after regenerating data with generate_data.py.
+"""
+
+import pandas as pd
+
+# Low-cardinality string columns become dictionary-encoded Parquet columns
+CATEGORICAL_COLS = {
+    'data/inventory.csv': ['make', 'model', 'color', 'condition', 'trim',
+                           'transmission', 'fuel_type'],
+    'data/competitors.csv': ['make', 'model', 'dealer_name', 'condition', 'trim'],
+    'data/customer_inquiries.csv': ['customer_type', 'status', 'preferred_contact'],
+    'data/sales_history.csv': ['make']
+}
+
+def convert_all():
+    for csv_path, categoricals in CATEGORICAL_COLS.items():
+        df = pd.read_csv(csv_path)
+
+        for col in categoricals:
+            df[col] = df[col].astype('category')
+
+        parquet_path = csv_path.rsplit('.', 1)[0] + '.parquet'
+        df.to_parquet(parquet_path, engine='pyarrow')
+
+        print(f"✅ {csv_path} → {parquet_path} ({len(df)} rows)")
+
+if __name__ == "__main__":
+    print("📦 Converting data files to Parquet...\n")
+    convert_all()
+    print("\n✅ Conversion complete!")
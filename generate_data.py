@@ -1,12 +1,97 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-from faker import Faker
-import random
+import string
+from datetime import datetime
 import json
 
-fake = Faker()
-np.random.seed(42)
+def _pyarrow():
+    """pyarrow modules, imported on first write (or (None, None))"""
+
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return None, None
+    return pa, pacsv
+
+# One generator reused by every vectorized builder: a single seeded
+# PCG64 stream instead of the global Mersenne Twister state
+rng = np.random.default_rng(42)
+
+# Name pools lifted straight from faker's locale data: same realism as
+# fake.name(), but drawable as whole arrays instead of one provider
+# dispatch per row. Loaded lazily - faker's locale tree is by far the
+# slowest import in this module and only the inquiry generator needs it.
+_NAME_POOLS = None
+
+def _name_pools():
+    global _NAME_POOLS
+    if _NAME_POOLS is None:
+        from faker.providers.person.en_US import Provider
+        _NAME_POOLS = (np.array(list(Provider.first_names)),
+                       np.array(list(Provider.last_names)))
+    return _NAME_POOLS
+
+_VIN_LETTERS = np.array(list(string.ascii_uppercase))
+_VIN_DIGITS = np.array(list('0123456789'))
+
+# Opt-in numba kernel for the price arithmetic. At the default n=50 the
+# JIT compile costs far more than it saves, so it stays off unless the
+# generator is scaled up for load tests.
+_USE_NUMBA = os.getenv('GENERATE_DATA_NUMBA', '').lower() in ('1', 'true', 'yes')
+
+if _USE_NUMBA:
+    try:
+        from numba import njit, prange
+    except ImportError:
+        _USE_NUMBA = False
+
+if _USE_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _compute_prices(base_price, year, mileage, markup):
+        # One fused pass: no NumPy temporaries for the intermediate terms
+        n = base_price.shape[0]
+        cost = np.empty(n)
+        current = np.empty(n)
+        for i in prange(n):
+            dep = (2024 - year[i]) * 0.10
+            mf = (mileage[i] / 50000) * 0.05
+            c = base_price[i] * (1.0 - dep - mf)
+            cost[i] = c
+            current[i] = c * markup[i]
+        return cost, current
+else:
+    def _compute_prices(base_price, year, mileage, markup):
+        depreciation = (2024 - year) * 0.10
+        mileage_factor = (mileage / 50000) * 0.05
+        cost = base_price * (1 - depreciation - mileage_factor)
+        return cost, cost * markup
+
+def _generate_vins(n):
+    """All n VIN-style codes (3 letters + 8 digits) in two array draws"""
+
+    letters = rng.choice(_VIN_LETTERS, size=(n, 3)).view('U3').ravel()
+    digits = rng.choice(_VIN_DIGITS, size=(n, 8)).view('U8').ravel()
+    return np.char.add(letters, digits)
+
+def _generate_names(n):
+    first_names, last_names = _name_pools()
+    first = first_names[rng.integers(0, len(first_names), n)]
+    last = last_names[rng.integers(0, len(last_names), n)]
+    return np.char.add(np.char.add(first, ' '), last)
+
+def _iso_ago(amounts, unit):
+    """ISO strings for now-minus-offsets, via one datetime64 array op
+
+    Replaces per-row datetime.now() - timedelta(...) object churn: the
+    subtraction happens on the whole int array in C and only the final
+    formatting touches Python-level strings.
+    """
+
+    stamps = np.datetime64(datetime.now()) - amounts.astype(f'timedelta64[{unit}]')
+    return pd.Series(stamps).dt.strftime('%Y-%m-%dT%H:%M:%S').to_numpy()
 
 def generate_inventory(n=50):
     """Generate realistic vehicle inventory"""
@@ -49,185 +134,245 @@ def generate_inventory(n=50):
         }
     }
     
-    inventory = []
-    
-    for i in range(n):
-        make = random.choice(list(vehicles_db.keys()))
-        vehicle_info = vehicles_db[make]
-        model = random.choice(vehicle_info['models'])
-        year = random.randint(2021, 2024)
-        
-        # More realistic mileage based on year
-        age = 2024 - year
-        base_mileage = age * random.randint(8000, 15000)
-        mileage = base_mileage + random.randint(0, 5000)
-        
-        # Pricing logic
-        price_min, price_max = vehicle_info['price_range']
-        base_price = random.randint(price_min, price_max)
-        
-        # Adjust for year and mileage
-        depreciation = (2024 - year) * 0.10
-        mileage_factor = (mileage / 50000) * 0.05
-        
-        cost = base_price * (1 - depreciation - mileage_factor)
-        current_price = cost * random.uniform(1.15, 1.35)  # 15-35% markup
-        
-        # Days in inventory (some aged inventory)
-        days_weights = [0.4, 0.3, 0.2, 0.1]  # Most are fresh
-        days_ranges = [(1, 30), (31, 60), (61, 90), (91, 150)]
-        days_range = random.choices(days_ranges, weights=days_weights)[0]
-        days_in_inventory = random.randint(*days_range)
-        
-        inventory.append({
-            'vin': fake.bothify(text='???########').upper(),
-            'stock_number': f'STK{10000 + i}',
-            'make': make,
-            'model': model,
-            'year': year,
-            'mileage': mileage,
-            'cost': round(cost, 2),
-            'current_price': round(current_price, 2),
-            'msrp': round(base_price, 2),
-            'days_in_inventory': days_in_inventory,
-            'color': random.choice(['Black', 'White', 'Silver', 'Gray', 'Blue', 'Red', 'Green']),
-            'condition': 'New' if year == 2024 else random.choice(['Used', 'Certified Pre-Owned']),
-            'trim': random.choice(['Base', 'LE', 'XLE', 'Limited', 'Sport', 'Premium']),
-            'transmission': random.choice(['Automatic', 'Manual', 'CVT']),
-            'fuel_type': random.choice(['Gasoline', 'Hybrid', 'Electric', 'Diesel']),
-            'popularity_score': vehicle_info['popularity'],
-            'last_price_change': (datetime.now() - timedelta(days=random.randint(1, 30))).isoformat(),
-            'view_count': random.randint(5, 200),
-            'inquiry_count': random.randint(0, 15)
-        })
-    
-    return pd.DataFrame(inventory)
+    makes = np.array(list(vehicles_db))
+    models_by_make = [vehicles_db[m]['models'] for m in makes]
+    model_counts = np.array([len(models) for models in models_by_make])
+    price_min = np.array([vehicles_db[m]['price_range'][0] for m in makes])
+    price_max = np.array([vehicles_db[m]['price_range'][1] for m in makes])
+    popularity = np.array([vehicles_db[m]['popularity'] for m in makes])
+
+    # Padded (make, model) lookup table so model picks are one fancy-index
+    model_table = np.empty((len(makes), model_counts.max()), dtype=object)
+    for i, models in enumerate(models_by_make):
+        model_table[i, :len(models)] = models
+
+    # Draw every column as one array instead of n Python-level calls
+    make_idx = rng.integers(0, len(makes), n)
+    model_idx = rng.integers(0, model_counts[make_idx])
+    year = rng.integers(2021, 2025, n)
+
+    # More realistic mileage based on year
+    age = 2024 - year
+    mileage = age * rng.integers(8000, 15001, n) + rng.integers(0, 5001, n)
+
+    # Pricing logic, adjusted for year and mileage
+    base_price = rng.integers(price_min[make_idx], price_max[make_idx] + 1)
+    markup = rng.uniform(1.15, 1.35, n)  # 15-35% markup
+    cost, current_price = _compute_prices(base_price, year, mileage, markup)
+
+    # Days in inventory (some aged inventory): pick an age bucket per
+    # vehicle, then a uniform day within that bucket. The bucket draw is a
+    # precomputed cdf + one searchsorted pass rather than rng.choice(p=...),
+    # which re-normalizes the weights on every call.
+    days_cdf = np.cumsum([0.4, 0.3, 0.2, 0.1])  # Most are fresh
+    days_cdf[-1] = 1.0  # guard the float cumsum against u just below 1
+    bucket_low = np.array([1, 31, 61, 91])
+    bucket_high = np.array([30, 60, 90, 150])
+    bucket = np.searchsorted(days_cdf, rng.random(n), side='right')
+    days_in_inventory = rng.integers(bucket_low[bucket], bucket_high[bucket] + 1)
+
+    return pd.DataFrame({
+        'vin': _generate_vins(n),
+        'stock_number': [f'STK{10000 + i}' for i in range(n)],
+        'make': makes[make_idx],
+        'model': model_table[make_idx, model_idx],
+        'year': year,
+        'mileage': mileage,
+        'cost': np.round(cost, 2),
+        'current_price': np.round(current_price, 2),
+        'msrp': base_price,
+        'days_in_inventory': days_in_inventory,
+        'color': rng.choice(['Black', 'White', 'Silver', 'Gray', 'Blue', 'Red', 'Green'], n),
+        'condition': np.where(year == 2024, 'New',
+                              rng.choice(['Used', 'Certified Pre-Owned'], n)),
+        'trim': rng.choice(['Base', 'LE', 'XLE', 'Limited', 'Sport', 'Premium'], n),
+        'transmission': rng.choice(['Automatic', 'Manual', 'CVT'], n),
+        'fuel_type': rng.choice(['Gasoline', 'Hybrid', 'Electric', 'Diesel'], n),
+        'popularity_score': popularity[make_idx],
+        'last_price_change': _iso_ago(rng.integers(1, 31, n), 'D'),
+        'view_count': rng.integers(5, 201, n),
+        'inquiry_count': rng.integers(0, 16, n)
+    }).astype({
+        # Down-cast before serialization: smaller files, and every
+        # consumer inherits the narrow dtypes from Parquet for free
+        'year': 'int16', 'mileage': 'int32', 'cost': 'float32',
+        'current_price': 'float32', 'msrp': 'int32',
+        'days_in_inventory': 'int16', 'popularity_score': 'float32',
+        'view_count': 'int32', 'inquiry_count': 'int16',
+        # Low-cardinality strings as dictionary-encoded categories
+        'make': 'category', 'model': 'category', 'color': 'category',
+        'condition': 'category', 'trim': 'category',
+        'transmission': 'category', 'fuel_type': 'category'
+    })
 
 def generate_competitor_data(inventory_df):
     """Generate competitor listings for market analysis"""
     
-    competitor_data = []
     competitor_names = [
         'AutoNation', 'CarMax', 'Lithia Motors', 'Penske Automotive',
         'Sonic Automotive', 'Local Motors', 'City Auto Group'
     ]
-    
-    for _, vehicle in inventory_df.iterrows():
-        # Generate 3-7 competitor listings per vehicle type
-        num_competitors = random.randint(3, 7)
-        
-        for _ in range(num_competitors):
-            # Price variance
-            price_factor = random.uniform(0.92, 1.08)
-            competitor_price = vehicle['current_price'] * price_factor
-            
-            # Mileage variance
-            mileage_diff = random.randint(-8000, 8000)
-            competitor_mileage = max(1000, vehicle['mileage'] + mileage_diff)
-            
-            competitor_data.append({
-                'make': vehicle['make'],
-                'model': vehicle['model'],
-                'year': vehicle['year'],
-                'mileage': competitor_mileage,
-                'price': round(competitor_price, 2),
-                'dealer_name': random.choice(competitor_names),
-                'distance_miles': random.randint(2, 45),
-                'listing_date': (datetime.now() - timedelta(days=random.randint(1, 60))).isoformat(),
-                'condition': vehicle['condition'],
-                'trim': random.choice(['Base', 'LE', 'XLE', 'Limited', 'Sport'])
-            })
-    
-    return pd.DataFrame(competitor_data)
+
+    # Generate 3-7 competitor listings per vehicle type: draw the count per
+    # vehicle, then np.repeat each source column by those counts instead of
+    # iterating rows
+    counts = rng.integers(3, 8, len(inventory_df))
+    total = int(counts.sum())
+
+    def rep(col):
+        return np.repeat(inventory_df[col].to_numpy(), counts)
+
+    # Price and mileage variance around the repeated vehicle rows
+    price_factor = rng.uniform(0.92, 1.08, total)
+    mileage_diff = rng.integers(-8000, 8001, total)
+
+    return pd.DataFrame({
+        'make': rep('make'),
+        'model': rep('model'),
+        'year': rep('year'),
+        'mileage': np.maximum(1000, rep('mileage') + mileage_diff),
+        'price': np.round(rep('current_price') * price_factor, 2),
+        'dealer_name': rng.choice(competitor_names, total),
+        'distance_miles': rng.integers(2, 46, total),
+        'listing_date': _iso_ago(rng.integers(1, 61, total), 'D'),
+        'condition': rep('condition'),
+        'trim': rng.choice(['Base', 'LE', 'XLE', 'Limited', 'Sport'], total)
+    }).astype({
+        'year': 'int16', 'mileage': 'int32', 'price': 'float32',
+        'distance_miles': 'int16',
+        'make': 'category', 'model': 'category', 'dealer_name': 'category',
+        'condition': 'category', 'trim': 'category'
+    })
 
 def generate_customer_inquiries(inventory_df, n=25):
     """Generate customer lead data"""
     
-    inquiries = []
-    
-    for i in range(n):
-        vehicle = inventory_df.sample(1).iloc[0]
-        
-        # Customer types
-        customer_types = ['hot_lead', 'warm_lead', 'cold_lead', 'price_shopper']
-        customer_type = random.choices(
-            customer_types,
-            weights=[0.15, 0.35, 0.30, 0.20]
-        )[0]
-        
-        # Generate inquiry message
-        messages = {
-            'hot_lead': [
-                f"I'm very interested in the {vehicle['year']} {vehicle['make']} {vehicle['model']}. Can I come see it today?",
-                f"Is the {vehicle['make']} {vehicle['model']} still available? I'd like to buy this week.",
-                f"I've been looking for exactly this car! What's your best price?"
-            ],
-            'warm_lead': [
-                f"Can you tell me more about the {vehicle['year']} {vehicle['make']} {vehicle['model']}?",
-                f"I'm interested in this vehicle. Does it have a clean title?",
-                f"What financing options do you have for the {vehicle['model']}?"
-            ],
-            'cold_lead': [
-                f"Just browsing. Is this {vehicle['make']} {vehicle['model']} negotiable on price?",
-                f"I might be interested. Can you send me more photos?",
-                f"How much would you take for this?"
-            ],
-            'price_shopper': [
-                f"I found this same car for ${vehicle['current_price'] * 0.95:.0f} elsewhere. Can you match?",
-                f"Your price seems high. What's your absolute lowest price?",
-                f"I'm comparing prices. What discounts can you offer?"
-            ]
-        }
-        
-        inquiries.append({
-            'inquiry_id': f'INQ{20000 + i}',
-            'vin': vehicle['vin'],
-            'stock_number': vehicle['stock_number'],
-            'customer_name': fake.name(),
-            'customer_email': fake.email(),
-            'customer_phone': fake.phone_number(),
-            'customer_type': customer_type,
-            'message': random.choice(messages[customer_type]),
-            'timestamp': (datetime.now() - timedelta(hours=random.randint(1, 72))).isoformat(),
-            'status': random.choice(['new', 'pending', 'responded']),
-            'preferred_contact': random.choice(['email', 'phone', 'text']),
-            'budget_max': round(vehicle['current_price'] * random.uniform(0.90, 1.05), 2),
-            'trade_in': random.choice([True, False]),
-            'financing_needed': random.choice([True, False])
-        })
-    
-    return pd.DataFrame(inquiries)
+    # One replacement sample for every inquiry instead of n single-row picks
+    sampled = inventory_df.sample(n, replace=True, random_state=rng).reset_index(drop=True)
+
+    customer_types = np.array(['hot_lead', 'warm_lead', 'cold_lead', 'price_shopper'])
+    type_cdf = np.cumsum([0.15, 0.35, 0.30, 0.20])
+    type_cdf[-1] = 1.0
+    type_idx = np.searchsorted(type_cdf, rng.random(n), side='right')
+    variant = rng.integers(0, 3, n)
+
+    # Message templates indexed by (customer type, variant); the only
+    # per-row Python work left is the template substitution itself
+    templates = [
+        ["I'm very interested in the {year} {make} {model}. Can I come see it today?",
+         "Is the {make} {model} still available? I'd like to buy this week.",
+         "I've been looking for exactly this car! What's your best price?"],
+        ["Can you tell me more about the {year} {make} {model}?",
+         "I'm interested in this vehicle. Does it have a clean title?",
+         "What financing options do you have for the {model}?"],
+        ["Just browsing. Is this {make} {model} negotiable on price?",
+         "I might be interested. Can you send me more photos?",
+         "How much would you take for this?"],
+        ["I found this same car for ${price:.0f} elsewhere. Can you match?",
+         "Your price seems high. What's your absolute lowest price?",
+         "I'm comparing prices. What discounts can you offer?"]
+    ]
+
+    years = sampled['year'].to_numpy()
+    makes = sampled['make'].to_numpy()
+    models = sampled['model'].to_numpy()
+    prices = sampled['current_price'].to_numpy()
+
+    messages = [
+        templates[t][v].format(year=years[i], make=makes[i], model=models[i],
+                               price=prices[i] * 0.95)
+        for i, (t, v) in enumerate(zip(type_idx, variant))
+    ]
+
+    names = _generate_names(n)
+
+    return pd.DataFrame({
+        'inquiry_id': [f'INQ{20000 + i}' for i in range(n)],
+        'vin': sampled['vin'].to_numpy(),
+        'stock_number': sampled['stock_number'].to_numpy(),
+        'customer_name': names,
+        'customer_email': [f"{name.replace(' ', '.').lower()}{i}@example.com"
+                           for i, name in enumerate(names)],
+        'customer_phone': [f'555-{a:03d}-{b:04d}' for a, b in
+                           zip(rng.integers(200, 1000, n), rng.integers(0, 10000, n))],
+        'customer_type': customer_types[type_idx],
+        'message': messages,
+        'timestamp': _iso_ago(rng.integers(1, 73, n), 'h'),
+        'status': rng.choice(['new', 'pending', 'responded'], n),
+        'preferred_contact': rng.choice(['email', 'phone', 'text'], n),
+        'budget_max': np.round(prices * rng.uniform(0.90, 1.05, n), 2),
+        'trade_in': rng.integers(0, 2, n).astype(bool),
+        'financing_needed': rng.integers(0, 2, n).astype(bool)
+    }).astype({
+        'budget_max': 'float32',
+        'customer_type': 'category', 'status': 'category',
+        'preferred_contact': 'category'
+    })
 
 def generate_sales_history(n=150):
     """Generate historical sales for ML training"""
     
-    sales = []
-    
-    for i in range(n):
-        sale_date = datetime.now() - timedelta(days=random.randint(1, 365))
-        
-        make = random.choice(['Toyota', 'Honda', 'Ford', 'Chevrolet', 'Tesla'])
-        year = random.randint(2019, 2023)
-        
-        base_price = random.randint(22000, 60000)
-        sold_price = base_price * random.uniform(0.85, 0.98)
-        
-        sales.append({
-            'sale_id': f'SALE{30000 + i}',
-            'sale_date': sale_date.isoformat(),
-            'make': make,
-            'year': year,
-            'original_price': round(base_price, 2),
-            'sold_price': round(sold_price, 2),
-            'discount': round(base_price - sold_price, 2),
-            'days_to_sell': random.randint(3, 120),
-            'season': (sale_date.month - 1) // 3,  # 0=Q1, 1=Q2, 2=Q3, 3=Q4
-            'gross_profit': round(sold_price * random.uniform(0.08, 0.18), 2),
-            'financing': random.choice([True, False]),
-            'trade_in': random.choice([True, False])
-        })
-    
-    return pd.DataFrame(sales)
+    sale_dates = pd.Series(
+        np.datetime64(datetime.now()) - rng.integers(1, 366, n).astype('timedelta64[D]')
+    )
+
+    base_price = rng.integers(22000, 60001, n)
+    sold_price = base_price * rng.uniform(0.85, 0.98, n)
+
+    return pd.DataFrame({
+        'sale_id': [f'SALE{30000 + i}' for i in range(n)],
+        'sale_date': sale_dates.dt.strftime('%Y-%m-%dT%H:%M:%S'),
+        'make': rng.choice(['Toyota', 'Honda', 'Ford', 'Chevrolet', 'Tesla'], n),
+        'year': rng.integers(2019, 2024, n),
+        'original_price': base_price,
+        'sold_price': np.round(sold_price, 2),
+        'discount': np.round(base_price - sold_price, 2),
+        'days_to_sell': rng.integers(3, 121, n),
+        'season': (sale_dates.dt.month.to_numpy() - 1) // 3,  # 0=Q1 .. 3=Q4
+        'gross_profit': np.round(sold_price * rng.uniform(0.08, 0.18, n), 2),
+        'financing': rng.integers(0, 2, n).astype(bool),
+        'trade_in': rng.integers(0, 2, n).astype(bool)
+    }).astype({
+        'year': 'int16', 'original_price': 'int32', 'sold_price': 'float32',
+        'discount': 'float32', 'days_to_sell': 'int16', 'season': 'int8',
+        'gross_profit': 'float32', 'make': 'category'
+    })
+
+def _with_seed(seed, fn, *args):
+    """Run one generator in a worker process on its own deterministic stream
+
+    Forked workers inherit the parent's rng state, so without reseeding all
+    three parallel generators would draw identical (correlated) streams.
+    """
+
+    global rng
+    rng = np.random.default_rng(seed)
+    return fn(*args)
+
+def _write_csv(df, path):
+    """Write a CSV through pyarrow's parallel C++ writer when available"""
+
+    pa, pacsv = _pyarrow()
+    if pa is not None:
+        pacsv.write_csv(
+            pa.Table.from_pandas(df, preserve_index=False), path,
+            # Quote like pandas does: only when a field needs it
+            write_options=pacsv.WriteOptions(quoting_style='needed')
+        )
+    else:
+        df.to_csv(path, index=False)
+
+def _write_dataset(df, name):
+    """CSV plus its Parquet sibling for one generated dataset
+
+    Parquet is columnar, typed and compressed, so readers (the dashboard's
+    get_df, test_agent_decisions.py) skip text parsing and dtype inference
+    entirely; the CSV stays for anything that wants text.
+    """
+
+    _write_csv(df, f'data/{name}.csv')
+    if _pyarrow()[0] is not None:
+        df.to_parquet(f'data/{name}.parquet', engine='pyarrow', compression='zstd')
 
 # Generate and save all data
 if __name__ == "__main__":
@@ -237,31 +382,50 @@ if __name__ == "__main__":
     print("📊 Creating inventory...")
     inventory = generate_inventory(50)
     
-    print("🔍 Creating competitor data...")
-    competitors = generate_competitor_data(inventory)
-    
-    print("📧 Creating customer inquiries...")
-    inquiries = generate_customer_inquiries(inventory, 25)
-    
-    print("💰 Creating sales history...")
-    sales_history = generate_sales_history(150)
-    
-    # Save to CSV
-    inventory.to_csv('data/inventory.csv', index=False)
-    competitors.to_csv('data/competitors.csv', index=False)
-    inquiries.to_csv('data/customer_inquiries.csv', index=False)
-    sales_history.to_csv('data/sales_history.csv', index=False)
+    # The remaining three datasets depend only on the inventory (or on
+    # nothing), so build them in parallel workers - and hand each frame to
+    # a background writer thread the moment it is ready, so file IO
+    # overlaps with the generation still in flight
+    print("🔍 Creating competitor, inquiry and sales data...")
+    datasets = {}
+
+    with ProcessPoolExecutor(max_workers=3) as pool, \
+         ThreadPoolExecutor(max_workers=4) as writer:
+
+        writes = [writer.submit(_write_dataset, inventory, 'inventory')]
+
+        pending = {
+            pool.submit(_with_seed, 43, generate_competitor_data, inventory): 'competitors',
+            pool.submit(_with_seed, 44, generate_customer_inquiries, inventory, 25): 'customer_inquiries',
+            pool.submit(_with_seed, 45, generate_sales_history, 150): 'sales_history'
+        }
+
+        for future in as_completed(pending):
+            name = pending[future]
+            datasets[name] = future.result()
+            writes.append(writer.submit(_write_dataset, datasets[name], name))
+
+        for write in writes:
+            write.result()
+
+    competitors = datasets['competitors']
+    inquiries = datasets['customer_inquiries']
+    sales_history = datasets['sales_history']
     
-    # Save summary stats
+    # Save summary stats - each aggregate computed once, reused by the
+    # prints below instead of re-scanning and re-masking the frame
+    aged_count = int((inventory['days_in_inventory'].to_numpy() > 60).sum())
+    total_value = float(inventory['current_price'].to_numpy().sum())
+
     summary = {
         'generated_at': datetime.now().isoformat(),
         'inventory_count': len(inventory),
         'competitor_listings': len(competitors),
         'customer_inquiries': len(inquiries),
         'sales_history': len(sales_history),
-        'total_inventory_value': float(inventory['current_price'].sum()),
+        'total_inventory_value': total_value,
         'avg_days_in_stock': float(inventory['days_in_inventory'].mean()),
-        'aged_inventory_count': len(inventory[inventory['days_in_inventory'] > 60])
+        'aged_inventory_count': aged_count
     }
     
     with open('data/summary.json', 'w') as f:
@@ -272,5 +436,5 @@ if __name__ == "__main__":
     print(f"   • Competitor listings: {len(competitors)}")
     print(f"   • Customer inquiries: {len(inquiries)}")
     print(f"   • Sales history: {len(sales_history)} records")
-    print(f"   • Total inventory value: ${inventory['current_price'].sum():,.2f}")
-    print(f"   • Aged inventory (60+ days): {len(inventory[inventory['days_in_inventory'] > 60])}")
\ No newline at end of file
+    print(f"   • Total inventory value: ${total_value:,.2f}")
+    print(f"   • Aged inventory (60+ days): {aged_count}")
\ No newline at end of file
@@ -0,0 +1,29 @@
+"""
+Gunicorn config for serving the dashboard.
+
+The Werkzeug dev server handles one request at a time, so a single
+/api/run-agent call (seconds of Bedrock latency) blocks the whole
+dashboard. Gevent workers let the I/O-bound Bedrock waits overlap with
+other requests.
+
+Run with: gunicorn -c gunicorn_conf.py app:app
+"""
+
+# Patch at config-load time: gunicorn reads this file before preloading
+# app.py, so boto3/requests sockets become gevent-cooperative instead of
+# blocking an entire worker per call
+from gevent import monkey
+monkey.patch_all()
+
+bind = "0.0.0.0:5000"
+
+worker_class = "gevent"
+workers = 2
+worker_connections = 100
+
+# Import the app (and its cached DataFrames / Bedrock client setup) once
+# in the master, then share the pages copy-on-write across workers
+preload_app = True
+
+accesslog = "-"
+errorlog = "-"
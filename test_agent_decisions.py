@@ -1,11 +1,48 @@
+import os
 import pandas as pd
 from agents.bedrock_agent import BedrockAgentCore
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps_indent(obj):
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+# Only what agent_decision_loop actually reads: the decision context, the
+# competitor price summary, and the VIN / inquiry-id validation columns
+USECOLS = {
+    'inventory': ['vin', 'stock_number', 'year', 'make', 'model',
+                  'current_price', 'cost', 'days_in_inventory'],
+    'competitors': ['make', 'model', 'price'],
+    'customer_inquiries': ['inquiry_id', 'vin', 'stock_number',
+                           'customer_name', 'customer_type', 'message', 'status']
+}
+
+DTYPES = {
+    'inventory': {'year': 'int16', 'current_price': 'float32',
+                  'cost': 'float32', 'days_in_inventory': 'int16',
+                  'make': 'category', 'model': 'category'},
+    'competitors': {'price': 'float32', 'make': 'category', 'model': 'category'},
+    'customer_inquiries': {'customer_type': 'category', 'status': 'category'}
+}
+
+def load(name):
+    """Prefer the typed Parquet sibling generate_data.py writes"""
+
+    parquet = f'data/{name}.parquet'
+    if os.path.exists(parquet):
+        return pd.read_parquet(parquet, engine='pyarrow', columns=USECOLS[name])
+    return pd.read_csv(f'data/{name}.csv', usecols=USECOLS[name], dtype=DTYPES[name])
+
 # Load data
-inventory = pd.read_csv('data/inventory.csv')
-competitors = pd.read_csv('data/competitors.csv')
-inquiries = pd.read_csv('data/customer_inquiries.csv')
+inventory = load('inventory')
+competitors = load('competitors')
+inquiries = load('customer_inquiries')
 
 # Initialize agent
 agent = BedrockAgentCore()
@@ -22,7 +59,7 @@ decisions = agent.agent_decision_loop(inventory, competitors, inquiries)
 
 if decisions:
     print("✅ Agent returned decisions!\n")
-    print(json.dumps(decisions, indent=2))
+    print(_dumps_indent(decisions))
     
     # Check what was returned
     print("\n📋 Decision Summary:")
@@ -1,20 +1,30 @@
-import boto3
 import json
 from dotenv import load_dotenv
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson parses the per-chunk stream events several times faster;
+# stdlib json only as a fallback
+_loads = orjson.loads if orjson is not None else json.loads
+
 load_dotenv()
 print("DEBUG MODEL ID =", os.getenv("BEDROCK_MODEL_ID"))
 
-# Initialize Bedrock client
-bedrock_runtime = boto3.client(
-    service_name='bedrock-runtime',
-    region_name=os.getenv('AWS_REGION', 'us-east-1')
-)
-
 def test_claude():
     """Test AWS Bedrock connection with Claude"""
     
+    # Deferred: importing the agents package pulls in boto3 and pandas,
+    # which only the actual call needs
+    from agents.bedrock_agent import get_bedrock_client
+
+    # Shared tuned client (keep-alive, adaptive retries, big pool) - same
+    # instance BedrockAgentCore uses, so repeated calls reuse warm connections
+    bedrock_runtime = get_bedrock_client()
+    
     prompt = "You are a car dealership AI agent. Say hello and confirm you're ready to help sell cars!"
     
     # Bedrock request format for Claude
@@ -30,16 +40,20 @@ def test_claude():
     }
     
     try:
-        response = bedrock_runtime.invoke_model(
+        # Stream the response: tokens print as they arrive instead of
+        # blocking until the full body has landed
+        response = bedrock_runtime.invoke_model_with_response_stream(
             modelId=os.getenv('BEDROCK_MODEL_ID'),
-            body=json.dumps(request_body)
+            body=orjson.dumps(request_body) if orjson is not None else json.dumps(request_body)
         )
         
-        response_body = json.loads(response['body'].read())
-        assistant_message = response_body['content'][0]['text']
+        print("\nClaude says:")
+        for event in response['body']:
+            chunk = _loads(event['chunk']['bytes'])
+            if chunk.get('type') == 'content_block_delta':
+                print(chunk['delta']['text'], end='', flush=True)
         
-        print("✅ Bedrock Connection Successful!")
-        print(f"\nClaude says:\n{assistant_message}")
+        print("\n\n✅ Bedrock Connection Successful!")
         return True
         
     except Exception as e: